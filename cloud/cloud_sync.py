@@ -1,9 +1,9 @@
-from typing import Dict
+from typing import Dict, List, Sequence
 
-import requests
-
-from config import CLOUD_API_KEY, CLOUD_ENDPOINT, CLOUD_PROVIDER
-from cloud.firebase_sync import sync_to_firebase
+from config import CLOUD_PROVIDER
+from cloud.firebase_sync import sync_many_to_firebase, sync_to_firebase
+from cloud.rest_client import get_rest_client
+from db.database import format_timestamp
 
 
 def sync_to_cloud(record: Dict) -> bool:
@@ -14,26 +14,27 @@ def sync_to_cloud(record: Dict) -> bool:
     return False
 
 
-def _sync_via_rest(record: Dict) -> bool:
-    payload = {
+def sync_many_to_cloud(records: Sequence[Dict], client=None) -> List:
+    """Sync a batch of records and return the db_ids the provider acknowledged."""
+    if CLOUD_PROVIDER == "firebase":
+        return sync_many_to_firebase(records, client)
+    if CLOUD_PROVIDER == "rest":
+        client = client or get_rest_client()
+        acked = client.post_many([_rest_payload(record) for record in records])
+        return [record["db_id"] for record, ok in zip(records, acked) if ok]
+    return []
+
+
+def _rest_payload(record: Dict) -> Dict:
+    # db_id lets the server drop records it already ingested when a POST is retried
+    return {
+        "db_id": record["db_id"],
         "plate": record["plate"],
         "type": record["type"],
-        "entry_time": record["entry_time"],
-        "exit_time": record["exit_time"],
-    }
-    headers = {
-        "Authorization": f"Bearer {CLOUD_API_KEY}",
-        "Content-Type": "application/json",
+        "entry_time": format_timestamp(record["entry_time"]),
+        "exit_time": format_timestamp(record["exit_time"]),
     }
 
-    try:
-        response = requests.post(
-            CLOUD_ENDPOINT,
-            json=payload,
-            headers=headers,
-            timeout=10,
-        )
-        return response.status_code in (200, 201)
-    except Exception as exc:  # pragma: no cover - logging only
-        print("[CLOUD ERROR]", exc)
-        return False
+
+def _sync_via_rest(record: Dict) -> bool:
+    return get_rest_client().post(_rest_payload(record))
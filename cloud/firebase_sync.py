@@ -1,27 +1,65 @@
-from typing import Dict
+from typing import Dict, List, Sequence
 
-from config import DEVICE_ID, FIREBASE_COLLECTION
+from config import DEVICE_ID, FIREBASE_BATCH_SIZE, FIREBASE_COLLECTION
 from cloud.firebase_client import init_firebase
+from db.database import format_timestamp
 
+# Firestore rejects batched writes of more than 500 operations
+MAX_BATCH_WRITES = 500
 
-def sync_to_firebase(record: Dict) -> bool:
-    try:
-        db = init_firebase()
 
-        payload = {
-            "plate": record["plate"],
-            "type": record["type"],
-            "entry_time": record["entry_time"],
-            "exit_time": record["exit_time"],
-            "device_id": DEVICE_ID,
-            "db_id": record.get("db_id"),
-        }
+def _payload(record: Dict) -> Dict:
+    return {
+        "plate": record["plate"],
+        "type": record["type"],
+        "entry_time": format_timestamp(record["entry_time"]),
+        "exit_time": format_timestamp(record["exit_time"]),
+        "device_id": DEVICE_ID,
+        "db_id": record.get("db_id"),
+    }
+
 
-        doc_id = str(record.get("db_id", record["plate"]))
-        db.collection(FIREBASE_COLLECTION).document(doc_id).set(payload)
+def _document(db, record: Dict):
+    doc_id = str(record.get("db_id", record["plate"]))
+    return db.collection(FIREBASE_COLLECTION).document(doc_id)
+
+
+def sync_to_firebase(record: Dict, client=None) -> bool:
+    try:
+        db = client or init_firebase()
+        _document(db, record).set(_payload(record))
 
         return True
 
     except Exception as exc:  # pragma: no cover - logging only
         print("[FIREBASE ERROR]", exc)
         return False
+
+
+def sync_many_to_firebase(records: Sequence[Dict], client=None, batch_size: int = FIREBASE_BATCH_SIZE) -> List:
+    """Write records in WriteBatch commits and return the db_ids of every batch Firestore acknowledged.
+
+    ``client`` defaults to the shared Firestore client; any object with
+    ``batch()`` and ``collection()`` works, so a fake can stand in for it.
+    """
+    try:
+        db = client or init_firebase()
+    except Exception as exc:  # pragma: no cover - logging only
+        print("[FIREBASE ERROR]", exc)
+        return []
+
+    batch_size = max(1, min(batch_size, MAX_BATCH_WRITES))
+    acked: List = []
+    for start in range(0, len(records), batch_size):
+        chunk = records[start : start + batch_size]
+        batch = db.batch()
+        for record in chunk:
+            batch.set(_document(db, record), _payload(record))
+
+        try:
+            batch.commit()
+        except Exception as exc:  # pragma: no cover - logging only
+            print("[FIREBASE ERROR]", exc)
+            continue
+        acked.extend(record.get("db_id") for record in chunk)
+    return acked
@@ -0,0 +1,110 @@
+"""Keep-alive REST client for cloud sync with retries, gzip bodies and an optional bulk endpoint."""
+
+import gzip
+import json
+from threading import Lock
+from typing import Dict, List, Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import (
+    CLOUD_API_KEY,
+    CLOUD_BULK_ENDPOINT,
+    CLOUD_BULK_SIZE,
+    CLOUD_ENDPOINT,
+    CLOUD_GZIP,
+    CLOUD_RETRIES,
+    CLOUD_RETRY_BACKOFF,
+    CLOUD_TIMEOUT_SECONDS,
+)
+
+OK_STATUSES = (200, 201, 202)
+RETRY_STATUSES = (500, 502, 503, 504)
+
+
+class RestSyncClient:
+    """One pooled requests.Session per process, so records reuse the same TCP+TLS connection.
+
+    5xx responses and connection errors are retried with exponential backoff;
+    POSTs are not idempotent, so every payload carries its ``db_id`` and single
+    posts also send it as an ``Idempotency-Key`` header for the server to dedupe on.
+    When ``bulk_endpoint`` is set, ``post_many`` sends up to ``bulk_size``
+    records per request as NDJSON; otherwise it posts them one by one.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = CLOUD_ENDPOINT,
+        api_key: str = CLOUD_API_KEY,
+        bulk_endpoint: str = CLOUD_BULK_ENDPOINT,
+        bulk_size: int = CLOUD_BULK_SIZE,
+        compress: bool = CLOUD_GZIP,
+        retries: int = CLOUD_RETRIES,
+        backoff: float = CLOUD_RETRY_BACKOFF,
+        timeout: float = CLOUD_TIMEOUT_SECONDS,
+    ):
+        self.endpoint = endpoint
+        self.bulk_endpoint = bulk_endpoint
+        self.bulk_size = max(1, bulk_size)
+        self.compress = compress
+        self.timeout = timeout
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(max_retries=retry))
+        self.session.mount("http://", HTTPAdapter(max_retries=retry))
+        self.session.headers.update({"Authorization": f"Bearer {api_key}"})
+
+    def post(self, payload: Dict) -> bool:
+        headers = {"Idempotency-Key": str(payload["db_id"])} if "db_id" in payload else {}
+        return self._post(self.endpoint, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+    def post_many(self, payloads: Sequence[Dict]) -> List[bool]:
+        """Send every payload and return, in order, whether each one was acknowledged."""
+        if not self.bulk_endpoint:
+            return [self.post(payload) for payload in payloads]
+
+        acked: List[bool] = []
+        for start in range(0, len(payloads), self.bulk_size):
+            chunk = payloads[start : start + self.bulk_size]
+            body = "".join(json.dumps(payload) + "\n" for payload in chunk).encode("utf-8")
+            ok = self._post(self.bulk_endpoint, body, "application/x-ndjson")
+            acked.extend([ok] * len(chunk))
+        return acked
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _post(self, url: str, body: bytes, content_type: str, extra_headers: Optional[Dict] = None) -> bool:
+        headers = {"Content-Type": content_type, **(extra_headers or {})}
+        if self.compress:
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+
+        try:
+            response = self.session.post(url, data=body, headers=headers, timeout=self.timeout)
+            return response.status_code in OK_STATUSES
+        except Exception as exc:  # pragma: no cover - logging only
+            print("[CLOUD ERROR]", exc)
+            return False
+
+
+_client: Optional[RestSyncClient] = None
+_client_lock = Lock()
+
+
+def get_rest_client() -> RestSyncClient:
+    global _client
+
+    with _client_lock:
+        if _client is None:
+            _client = RestSyncClient()
+    return _client
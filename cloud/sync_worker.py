@@ -1,19 +1,56 @@
-from db.database import get_unsynced, mark_synced
-from cloud.cloud_sync import sync_to_cloud
+from itertools import islice
+from typing import Dict, List
 
+from config import FIREBASE_BATCH_SIZE, SYNC_PAGE_SIZE
+from db.database import iter_unsynced
+from db.writer import flush_writes, mark_synced_many
+from cloud.cloud_sync import sync_many_to_cloud
 
-def sync_pending() -> None:
-    rows = get_unsynced()
 
-    for row_id, plate, vtype, entry, exit_time in rows:
-        record = {
-            "plate": plate,
-            "type": vtype,
-            "entry_time": entry,
-            "exit_time": exit_time,
-            "db_id": row_id,
-        }
+def _record(row) -> Dict:
+    row_id, plate, vtype, entry, exit_time = row
+    return {
+        "plate": plate,
+        "type": vtype,
+        "entry_time": entry,
+        "exit_time": exit_time,
+        "db_id": row_id,
+    }
 
-        if sync_to_cloud(record):
-            mark_synced(row_id)
-            print(f"[SYNCED] {plate}")
+
+def sync_pending(
+    after_id: int = 0,
+    page_size: int = SYNC_PAGE_SIZE,
+    batch_size: int = FIREBASE_BATCH_SIZE,
+    client=None,
+) -> int:
+    """Push unsynced rows newer than ``after_id`` in batches and return the last id acknowledged without gaps.
+
+    The returned id stops before the first row that failed, so passing it back
+    in resumes an interrupted sync without skipping anything still unsynced.
+    ``client`` is handed to the provider, e.g. a fake Firestore client.
+    """
+    # Exits may still be waiting in the write-behind queue
+    flush_writes()
+    last_acked = after_id
+    gap = False
+
+    rows = iter_unsynced(page_size, after_id)
+    while True:
+        records: List[Dict] = [_record(row) for row in islice(rows, max(1, batch_size))]
+        if not records:
+            break
+
+        acked = sync_many_to_cloud(records, client)
+        if acked:
+            mark_synced_many(acked)
+            print(f"[SYNCED] {len(acked)}/{len(records)} records")
+
+        acked_ids = set(acked)
+        for record in records:
+            if gap or record["db_id"] not in acked_ids:
+                gap = True
+                break
+            last_acked = record["db_id"]
+
+    return last_acked
@@ -5,16 +5,50 @@ from pathlib import Path
 
 
 CAMERA_SOURCE = int(os.getenv("CAMERA_SOURCE", 0))  # 0 = laptop webcam, later Pi camera
+# Comma-separated camera indexes, video files or stream URLs served by one process
+CAMERA_SOURCES = [
+    int(source) if source.strip().isdigit() else source.strip()
+    for source in os.getenv("CAMERA_SOURCES", str(CAMERA_SOURCE)).split(",")
+    if source.strip()
+]
 DEVICE_ID = os.getenv("DEVICE_ID", "V.E.I.L_01")  # unique device identifier
+CAPTURE_BUFFER_SIZE = int(os.getenv("CAPTURE_BUFFER_SIZE", "2"))  # frames kept by the capture thread
+IMAGE_LOADER_WORKERS = int(os.getenv("IMAGE_LOADER_WORKERS", "4"))  # decode threads for main_video
+IMAGE_PREFETCH = int(os.getenv("IMAGE_PREFETCH", "16"))  # decoded images held ahead of inference
+PIPELINE_MODE = os.getenv("PIPELINE_MODE", "sequential")  # sequential | staged
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))
+_pipeline_concurrency = os.getenv("PIPELINE_CONCURRENCY", "detect=1,recognize=1,classify=1,sync=2")
+PIPELINE_CONCURRENCY = {
+    name.strip(): int(count)
+    for name, _, count in (item.partition("=") for item in _pipeline_concurrency.split(","))
+    if name.strip() and count.strip()
+}
+
+
+MOTION_GATE_ENABLED = os.getenv("MOTION_GATE_ENABLED", "true").lower() == "true"
+_motion_roi = [float(part) for part in os.getenv("MOTION_ROI", "").split(",") if part.strip()]
+MOTION_ROI = tuple(_motion_roi) if len(_motion_roi) == 4 else None  # x1,y1,x2,y2 as frame fractions
+MOTION_PIXEL_THRESHOLD = int(os.getenv("MOTION_PIXEL_THRESHOLD", "25"))
+MOTION_MIN_AREA = float(os.getenv("MOTION_MIN_AREA", "0.002"))  # fraction of ROI pixels that must change
+MOTION_HOLD_SECONDS = float(os.getenv("MOTION_HOLD_SECONDS", "2"))
+MOTION_FORCE_INTERVAL_SECONDS = float(os.getenv("MOTION_FORCE_INTERVAL_SECONDS", "5"))
+MOTION_DOWNSCALE_WIDTH = int(os.getenv("MOTION_DOWNSCALE_WIDTH", "160"))
 
 
 CLOUD_ENABLED = os.getenv("CLOUD_ENABLED", "true").lower() == "true"
 CLOUD_PROVIDER = os.getenv("CLOUD_PROVIDER", "firebase")
 CLOUD_ENDPOINT = os.getenv("CLOUD_ENDPOINT", "https://example.com/api/vehicles")
 CLOUD_API_KEY = os.getenv("CLOUD_API_KEY", "CHANGE_ME")
+CLOUD_BULK_ENDPOINT = os.getenv("CLOUD_BULK_ENDPOINT", "")  # NDJSON endpoint for batched REST sync, empty disables
+CLOUD_BULK_SIZE = int(os.getenv("CLOUD_BULK_SIZE", "500"))  # records per bulk request
+CLOUD_GZIP = os.getenv("CLOUD_GZIP", "false").lower() == "true"  # gzip REST request bodies; the server must decode them
+CLOUD_RETRIES = int(os.getenv("CLOUD_RETRIES", "3"))  # retries on 5xx and connection errors
+CLOUD_RETRY_BACKOFF = float(os.getenv("CLOUD_RETRY_BACKOFF", "0.5"))  # seconds, doubled per retry
+CLOUD_TIMEOUT_SECONDS = float(os.getenv("CLOUD_TIMEOUT_SECONDS", "10"))
 FIREBASE_CREDENTIALS = Path(os.getenv("FIREBASE_CREDENTIALS", "serviceAccount.json"))
 FIREBASE_COLLECTION = os.getenv("FIREBASE_COLLECTION", "vehicles")
 FIREBASE_CREDENTIALS_JSON = os.getenv("FIREBASE_CREDENTIALS_JSON")
+FIREBASE_BATCH_SIZE = int(os.getenv("FIREBASE_BATCH_SIZE", "500"))  # documents per WriteBatch commit, max 500
 
 
 MODELS_DIR = Path(os.getenv("MODELS_DIR", "models"))
@@ -27,6 +61,13 @@ PLATE_MODEL_URL = os.getenv(
 	"https://huggingface.co/keremberke/yolov8n-license-plate/resolve/main/yolov8n-license-plate.pt",
 )
 
+PLATE_DETECTOR_BACKEND = os.getenv("PLATE_DETECTOR_BACKEND", "torch")  # torch | onnx | onnx-int8
+PLATE_IMGSZ = int(os.getenv("PLATE_IMGSZ", "640"))
+PLATE_BATCH_SIZE = int(os.getenv("PLATE_BATCH_SIZE", "8"))  # frames per YOLO call in batched detection
+PLATE_BATCH_IMGSZ = int(os.getenv("PLATE_BATCH_IMGSZ", str(PLATE_IMGSZ)))  # letterbox square for batched calls
+PLATE_CALIBRATION_DIR = Path(os.getenv("PLATE_CALIBRATION_DIR", "data/indian_lp/val/images"))
+PLATE_CALIBRATION_SAMPLES = int(os.getenv("PLATE_CALIBRATION_SAMPLES", "128"))
+
 _plate_classes = os.getenv("PLATE_CLASS_IDS", "0")
 PLATE_CLASS_IDS = [int(cls.strip()) for cls in _plate_classes.split(",") if cls.strip()]
 PLATE_CONFIDENCE = float(os.getenv("PLATE_CONFIDENCE", "0.25"))
@@ -50,7 +91,37 @@ PLATE_MAX_LENGTH = int(os.getenv("PLATE_MAX_LENGTH", "12"))
 PLATE_MIN_DIGITS = int(os.getenv("PLATE_MIN_DIGITS", "3"))
 PLATE_REQUIRE_REGEX = os.getenv("PLATE_REQUIRE_REGEX", "true").lower() == "true"
 MIN_OCR_CONFIDENCE = float(os.getenv("MIN_OCR_CONFIDENCE", "0.45"))
-MIN_PLATE_HITS = int(os.getenv("MIN_PLATE_HITS", "2"))
+OCR_EARLY_EXIT_CONFIDENCE = float(os.getenv("OCR_EARLY_EXIT_CONFIDENCE", "0.8"))
+OCR_EARLY_EXIT_AGREEMENT = int(os.getenv("OCR_EARLY_EXIT_AGREEMENT", "2"))
+OCR_VARIANT_WAVE = int(os.getenv("OCR_VARIANT_WAVE", "2"))  # variants per crop per recognize call, 0 = all
+OCR_CACHE_SIZE = int(os.getenv("OCR_CACHE_SIZE", "32"))  # crops per camera source, 0 disables the read cache
+OCR_CACHE_TTL_SECONDS = float(os.getenv("OCR_CACHE_TTL_SECONDS", "5"))
+# Worst per-strip correlation for a hit; repeats of one plate score >= 0.97, a one-character change <= 0.88
+OCR_CACHE_MIN_SIMILARITY = float(os.getenv("OCR_CACHE_MIN_SIMILARITY", "0.95"))
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", "0"))  # 0 = read plates in-process
+OCR_QUEUE_SIZE = int(os.getenv("OCR_QUEUE_SIZE", "8"))
+OCR_QUEUE_POLICY = os.getenv("OCR_QUEUE_POLICY", "block")  # block | drop | merge
+OCR_MAX_BATCH = int(os.getenv("OCR_MAX_BATCH", "8"))
+
+# Unix socket of the optional warm-model daemon (python -m inference.daemon); empty disables it
+INFERENCE_SOCKET = os.getenv("INFERENCE_SOCKET", str(Path(".cache") / "veil-inference.sock"))
+MIN_PLATE_HITS = int(os.getenv("MIN_PLATE_HITS", "2"))  # 1 trusts single readings, above 1 fuses frames
+FUSION_THRESHOLD = float(os.getenv("FUSION_THRESHOLD", "0.95"))  # fused posterior needed to confirm a plate
+FUSION_MAX_MISMATCH = int(os.getenv("FUSION_MAX_MISMATCH", "2"))  # differing characters still fused together
+VOTE_TTL_SECONDS = float(os.getenv("VOTE_TTL_SECONDS", "10"))  # unconfirmed readings are forgotten after this
+VOTE_MAX_ENTRIES = int(os.getenv("VOTE_MAX_ENTRIES", "256"))  # candidate plates held per vote store
+
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")  # OFF | NORMAL | FULL | EXTRA
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHED_STATEMENTS = int(os.getenv("SQLITE_CACHED_STATEMENTS", "128"))
+DB_WRITE_BEHIND = os.getenv("DB_WRITE_BEHIND", "true").lower() == "true"  # queue writes for group commits
+DB_WRITE_BATCH = int(os.getenv("DB_WRITE_BATCH", "64"))  # statements per transaction at most
+DB_WRITE_DELAY_MS = float(os.getenv("DB_WRITE_DELAY_MS", "50"))  # wait after the first write before committing
+SYNC_PAGE_SIZE = int(os.getenv("SYNC_PAGE_SIZE", "500"))  # unsynced rows fetched per query
+TRACKER_ENABLED = os.getenv("TRACKER_ENABLED", "true").lower() == "true"
+TRACK_IOU_THRESHOLD = float(os.getenv("TRACK_IOU_THRESHOLD", "0.3"))
+TRACK_MAX_MISSES = int(os.getenv("TRACK_MAX_MISSES", "10"))  # frames a track survives without a matching box
+TRACK_RECHECK_FRAMES = int(os.getenv("TRACK_RECHECK_FRAMES", "15"))  # re-read confirmed tracks this often, 0 = never
 
 ENTRY_DEDUP_WINDOW_SECONDS = int(os.getenv("ENTRY_DEDUP_WINDOW_SECONDS", "4"))
 ENTRY_DEDUP_SIMILARITY = float(os.getenv("ENTRY_DEDUP_SIMILARITY", "0.92"))
@@ -1,11 +1,68 @@
+from datetime import datetime
 import sqlite3
-from typing import List, Tuple
+import threading
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from config import SQLITE_BUSY_TIMEOUT_MS, SQLITE_CACHED_STATEMENTS, SQLITE_SYNCHRONOUS, SYNC_PAGE_SIZE
 
 DB_NAME = "vehicles.db"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+ADD_ENTRY_SQL = """
+    INSERT INTO vehicles (plate, type, entry_time)
+    VALUES (?, ?, ?)
+"""
+ADD_EXIT_SQL = """
+    UPDATE vehicles
+    SET exit_time = ?
+    WHERE id = ? AND exit_time IS NULL
+"""
+MARK_SYNCED_SQL = """
+    UPDATE vehicles SET synced = 1 WHERE id = ?
+"""
+
+_local = threading.local()
+
+
+def now_ms() -> int:
+    """Current time as epoch milliseconds, the representation stored in entry_time/exit_time."""
+    return int(time.time() * 1000)
+
+
+def format_timestamp(epoch_ms: Optional[int]) -> Optional[str]:
+    """Local-time string for exports and the cloud payloads; None stays None."""
+    if epoch_ms is None:
+        return None
+    return datetime.fromtimestamp(epoch_ms / 1000.0).strftime(TIMESTAMP_FORMAT)
 
 
 def get_conn():
-    return sqlite3.connect(DB_NAME)
+    """Return this thread's persistent connection, opening it on first use."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.db_name == DB_NAME:
+        return conn
+
+    close_conn()
+    conn = sqlite3.connect(
+        DB_NAME,
+        timeout=SQLITE_BUSY_TIMEOUT_MS / 1000.0,
+        cached_statements=SQLITE_CACHED_STATEMENTS,
+    )
+    # WAL lets readers run alongside the writer; NORMAL skips the fsync on every commit
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+    conn.execute(f"PRAGMA busy_timeout={int(SQLITE_BUSY_TIMEOUT_MS)}")
+    _local.conn = conn
+    _local.db_name = DB_NAME
+    return conn
+
+
+def close_conn() -> None:
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
 
 
 def init_db():
@@ -13,17 +70,16 @@ def init_db():
     cur = conn.cursor()
 
     cur.execute("PRAGMA table_info(vehicles)")
-    columns = [row[1] for row in cur.fetchall()]
+    columns = {row[1]: row[2].upper() for row in cur.fetchall()}
 
     if not columns:
         _create_schema(cur)
-    elif "id" not in columns:
-        _migrate_schema(cur)
+    elif "id" not in columns or columns.get("entry_time") != "INTEGER":
+        _migrate_schema(cur, columns)
     else:
         _ensure_indexes(cur)
 
     conn.commit()
-    conn.close()
 
 
 def _create_schema(cur) -> None:
@@ -33,8 +89,8 @@ def _create_schema(cur) -> None:
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             plate TEXT NOT NULL,
             type TEXT,
-            entry_time TEXT,
-            exit_time TEXT,
+            entry_time INTEGER,
+            exit_time INTEGER,
             synced INTEGER DEFAULT 0
         )
         """
@@ -48,83 +104,159 @@ def _ensure_indexes(cur) -> None:
         CREATE INDEX IF NOT EXISTS idx_vehicles_plate ON vehicles (plate)
         """
     )
+    # Covers open-session restore and exit lookups; only vehicles still inside are indexed
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_vehicles_open
+        ON vehicles (plate, entry_time, type, exit_time)
+        WHERE exit_time IS NULL
+        """
+    )
+    # Covers the keyset pages of iter_unsynced; ids follow entry order, so this replaces the entry_time index
+    cur.execute("DROP INDEX IF EXISTS idx_vehicles_unsynced")
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_vehicles_unsynced_id
+        ON vehicles (id, plate, type, entry_time, exit_time, synced)
+        WHERE synced = 0 AND exit_time IS NOT NULL
+        """
+    )
+
+
+def _epoch_ms_sql(column: str) -> str:
+    # Legacy rows hold local "YYYY-MM-DD HH:MM:SS" strings; 'utc' converts them from local time
+    return (
+        f"CASE WHEN typeof({column}) = 'text' "
+        f"THEN CAST(strftime('%s', {column}, 'utc') AS INTEGER) * 1000 ELSE {column} END"
+    )
 
 
-def _migrate_schema(cur) -> None:
+def _migrate_schema(cur, columns) -> None:
+    """Rebuild the table with an id column and epoch-millisecond timestamps."""
     cur.execute("ALTER TABLE vehicles RENAME TO vehicles_legacy")
+    # Renamed tables keep their index names, which would make CREATE INDEX IF NOT EXISTS a no-op
+    cur.execute(
+        """
+        SELECT name FROM sqlite_master
+        WHERE type = 'index' AND tbl_name = 'vehicles_legacy' AND sql IS NOT NULL
+        """
+    )
+    for (index_name,) in cur.fetchall():
+        cur.execute(f"DROP INDEX {index_name}")
+
     _create_schema(cur)
+    id_column = "id, " if "id" in columns else ""
+    cur.execute(
+        f"""
+        INSERT INTO vehicles ({id_column}plate, type, entry_time, exit_time, synced)
+        SELECT {id_column}plate, type, {_epoch_ms_sql("entry_time")}, {_epoch_ms_sql("exit_time")}, synced
+        FROM vehicles_legacy
+        """
+    )
+    # Keep AUTOINCREMENT from reusing ids of rows deleted before the migration
     cur.execute(
         """
-        INSERT INTO vehicles (plate, type, entry_time, exit_time, synced)
-        SELECT plate, type, entry_time, exit_time, synced FROM vehicles_legacy
+        UPDATE sqlite_sequence
+        SET seq = (SELECT MAX(seq) FROM sqlite_sequence WHERE name IN ('vehicles', 'vehicles_legacy'))
+        WHERE name = 'vehicles'
         """
     )
     cur.execute("DROP TABLE vehicles_legacy")
 
 
-def add_entry(plate: str, vehicle_type: str, entry_time: str) -> int:
+def add_entry(plate: str, vehicle_type: str, entry_time: int) -> int:
     conn = get_conn()
     cur = conn.cursor()
 
-    cur.execute(
-        """
-        INSERT INTO vehicles (plate, type, entry_time)
-        VALUES (?, ?, ?)
-        """,
-        (plate, vehicle_type, entry_time),
-    )
+    cur.execute(ADD_ENTRY_SQL, (plate, vehicle_type, entry_time))
 
     conn.commit()
-    row_id = cur.lastrowid
-    conn.close()
-    return row_id
+    return cur.lastrowid
 
 
-def add_exit(row_id: int, exit_time: str):
+def add_exit(row_id: int, exit_time: int):
     conn = get_conn()
     cur = conn.cursor()
 
-    cur.execute(
-        """
-        UPDATE vehicles
-        SET exit_time = ?
-        WHERE id = ? AND exit_time IS NULL
-        """,
-        (exit_time, row_id),
-    )
+    cur.execute(ADD_EXIT_SQL, (exit_time, row_id))
 
     conn.commit()
-    conn.close()
 
 
-def get_unsynced() -> List[Tuple]:
+def get_open_sessions() -> List[Tuple]:
     conn = get_conn()
     cur = conn.cursor()
 
     cur.execute(
         """
-        SELECT id, plate, type, entry_time, exit_time
+        SELECT id, plate, type, entry_time
         FROM vehicles
-        WHERE synced = 0 AND exit_time IS NOT NULL
-        ORDER BY entry_time ASC
+        WHERE exit_time IS NULL
         """
     )
 
-    rows = cur.fetchall()
-    conn.close()
-    return rows
+    return cur.fetchall()
 
 
-def mark_synced(row_id: int):
+def find_open_session(plate: str) -> Optional[Tuple]:
     conn = get_conn()
     cur = conn.cursor()
 
     cur.execute(
         """
-        UPDATE vehicles SET synced = 1 WHERE id = ?
+        SELECT id, plate, type, entry_time
+        FROM vehicles
+        WHERE plate = ? AND exit_time IS NULL
+        ORDER BY entry_time DESC
+        LIMIT 1
         """,
-        (row_id,),
+        (plate,),
     )
 
+    return cur.fetchone()
+
+
+def get_unsynced() -> List[Tuple]:
+    return list(iter_unsynced())
+
+
+def iter_unsynced(page_size: int = SYNC_PAGE_SIZE, after_id: int = 0) -> Iterator[Tuple]:
+    """Yield unsynced, closed rows with id > ``after_id`` in id order, one page of rows in memory at a time."""
+    conn = get_conn()
+    page_size = max(1, page_size)
+
+    while True:
+        cur = conn.cursor()
+        cur.execute(
+            """
+            SELECT id, plate, type, entry_time, exit_time
+            FROM vehicles
+            WHERE synced = 0 AND exit_time IS NOT NULL AND id > ?
+            ORDER BY id
+            LIMIT ?
+            """,
+            (after_id, page_size),
+        )
+        rows = cur.fetchall()
+        yield from rows
+        if len(rows) < page_size:
+            return
+        after_id = rows[-1][0]
+
+
+def mark_synced_many(row_ids: Iterable[int]) -> None:
+    conn = get_conn()
+    cur = conn.cursor()
+
+    cur.executemany(MARK_SYNCED_SQL, ((row_id,) for row_id in row_ids))
+
+    conn.commit()
+
+
+def mark_synced(row_id: int):
+    conn = get_conn()
+    cur = conn.cursor()
+
+    cur.execute(MARK_SYNCED_SQL, (row_id,))
+
     conn.commit()
-    conn.close()
@@ -0,0 +1,197 @@
+"""Write-behind queue that groups exit/sync updates into shared transactions.
+
+The frame loop only enqueues; a background thread commits whatever has
+accumulated, up to ``max_batch`` statements or ``max_delay_ms`` after the
+first one, in a single transaction. Entries are inserted synchronously so
+their ids come from SQLite itself and stay unique across processes sharing
+the database file.
+"""
+
+import atexit
+from concurrent.futures import Future
+import queue
+from threading import Lock, Thread
+import time
+from typing import Dict, Iterable, List, Optional
+
+from config import DB_WRITE_BATCH, DB_WRITE_BEHIND, DB_WRITE_DELAY_MS
+from db import database
+
+_STOP = object()
+
+
+class WriteBehindWriter:
+    """Single writer thread owning its own connection; all mutations go through it in FIFO order."""
+
+    def __init__(self, max_batch: int = DB_WRITE_BATCH, max_delay_ms: float = DB_WRITE_DELAY_MS):
+        self.max_batch = max(1, max_batch)
+        self.max_delay = max(0.0, max_delay_ms) / 1000.0
+        self.committed = 0
+        self.transactions = 0
+        self.failed = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._thread = Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+
+    def add_exit(self, row_id: int, exit_time: int) -> Future:
+        return self._submit(database.ADD_EXIT_SQL, (exit_time, row_id))
+
+    def mark_synced(self, row_id: int) -> Future:
+        return self._submit(database.MARK_SYNCED_SQL, (row_id,))
+
+    def mark_synced_many(self, row_ids: Iterable[int]) -> Future:
+        return self._submit(database.MARK_SYNCED_SQL, [(row_id,) for row_id in row_ids], many=True)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until everything queued so far is committed."""
+        self._submit(None, ()).result(timeout)
+
+    def close(self) -> None:
+        """Commit the backlog, checkpoint the WAL to the main file and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": self._queue.qsize(),
+            "committed": self.committed,
+            "transactions": self.transactions,
+            "failed": self.failed,
+        }
+
+    def _submit(self, sql: Optional[str], params, many: bool = False) -> Future:
+        if self._closed:
+            raise RuntimeError("Database writer is closed.")
+        future: Future = Future()
+        self._queue.put((sql, params, many, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            stopping = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._commit(batch)
+            if stopping:
+                break
+
+        # Drain anything queued behind the stop marker, then make the last commits durable
+        leftovers = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                leftovers.append(item)
+        if leftovers:
+            self._commit(leftovers)
+        conn = database.get_conn()
+        conn.execute("PRAGMA wal_checkpoint(FULL)")
+        database.close_conn()
+
+    def _commit(self, batch: List) -> None:
+        statements = [item for item in batch if item[0] is not None]
+        failed = 0
+        conn = database.get_conn()
+        try:
+            with conn:
+                for sql, params, many, _ in statements:
+                    _execute(conn, sql, params, many)
+        except Exception as exc:
+            print("[DB WRITER ERROR]", exc)
+            # Retry one statement per transaction so a single bad row does not sink the group
+            for sql, params, many, future in statements:
+                try:
+                    with conn:
+                        _execute(conn, sql, params, many)
+                except Exception as row_exc:
+                    failed += 1
+                    future.set_exception(row_exc)
+        else:
+            self.transactions += 1
+
+        self.failed += failed
+        self.committed += len(statements) - failed
+        for *_, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+
+def _execute(conn, sql: str, params, many: bool) -> None:
+    if many:
+        conn.executemany(sql, params)
+    else:
+        conn.execute(sql, params)
+
+
+_writer: Optional[WriteBehindWriter] = None
+_writer_lock = Lock()
+
+
+def get_writer() -> WriteBehindWriter:
+    global _writer
+
+    with _writer_lock:
+        if _writer is None:
+            _writer = WriteBehindWriter()
+            atexit.register(shutdown_writer)
+    return _writer
+
+
+def shutdown_writer() -> None:
+    global _writer
+
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
+        print("[DB WRITER]", writer.stats())
+
+
+def flush_writes() -> None:
+    if _writer is not None:
+        _writer.flush()
+
+
+def add_entry(plate: str, vehicle_type: str, entry_time: int) -> int:
+    # Never queued: the id must come from this INSERT, or another writer on the same file could claim it
+    return database.add_entry(plate, vehicle_type, entry_time)
+
+
+def add_exit(row_id: int, exit_time: int) -> Optional[Future]:
+    """Queue the exit and return its future, or write it straight away (returning None) without write-behind."""
+    if DB_WRITE_BEHIND:
+        return get_writer().add_exit(row_id, exit_time)
+    database.add_exit(row_id, exit_time)
+    return None
+
+
+def mark_synced(row_id: int) -> None:
+    if DB_WRITE_BEHIND:
+        get_writer().mark_synced(row_id)
+    else:
+        database.mark_synced(row_id)
+
+
+def mark_synced_many(row_ids: Iterable[int]) -> None:
+    """Flag a whole acknowledged cloud batch in one executemany statement."""
+    if DB_WRITE_BEHIND:
+        get_writer().mark_synced_many(row_ids)
+    else:
+        database.mark_synced_many(row_ids)
@@ -1,9 +1,10 @@
 """YOLO-based plate detection with dynamic cropping heuristics."""
 
 from pathlib import Path
-from typing import List
+from typing import List, Sequence, Tuple
 
 import cv2
+import numpy as np
 
 if not hasattr(cv2, "setNumThreads"):
     cv2.setNumThreads = lambda *args, **kwargs: None  # type: ignore[attr-defined]
@@ -32,8 +33,14 @@ import requests
 from ultralytics import YOLO
 
 from config import (
+    PLATE_BATCH_IMGSZ,
+    PLATE_BATCH_SIZE,
+    PLATE_CALIBRATION_DIR,
+    PLATE_CALIBRATION_SAMPLES,
     PLATE_CLASS_IDS,
     PLATE_CONFIDENCE,
+    PLATE_DETECTOR_BACKEND,
+    PLATE_IMGSZ,
     PLATE_FORCE_TALL,
     PLATE_MARGIN,
     PLATE_MAX_RATIO,
@@ -49,7 +56,7 @@ from config import (
     PLATE_TALL_WIDTH_PAD,
     PLATE_TOP_EXTRA,
 )
-from detection.fallback import contour_detect_plates
+from detection.fallback import contour_detect_plate_boxes, contour_detect_plates
 
 _model_path = Path(PLATE_MODEL_PATH)
 if not _model_path.exists():
@@ -69,7 +76,127 @@ if not _model_path.exists():
     _model_path.write_bytes(response.content)
     print("Plate model download complete.")
 
-model = YOLO(str(_model_path))
+DETECTOR_BACKENDS = ("torch", "onnx", "onnx-int8")
+
+
+def _is_fresh(artifact: Path, source: Path) -> bool:
+    return artifact.exists() and artifact.stat().st_mtime >= source.stat().st_mtime
+
+
+def _export_onnx() -> Path:
+    """Export PLATE_MODEL_PATH to ONNX once and reuse the cached file afterwards."""
+    onnx_path = _model_path.with_suffix(".onnx")
+    if _is_fresh(onnx_path, _model_path):
+        return onnx_path
+
+    print(f"Exporting plate model to {onnx_path} ...")
+    # Dynamic axes let batched detection feed several frames (and other letterbox sizes) per call
+    exported = YOLO(str(_model_path)).export(format="onnx", imgsz=PLATE_IMGSZ, dynamic=True)
+    exported_path = Path(exported)
+    if exported_path != onnx_path:
+        exported_path.replace(onnx_path)
+    return onnx_path
+
+
+def _quantize_int8(onnx_path: Path) -> Path:
+    """Statically quantise the ONNX detector to int8, calibrating on PLATE_CALIBRATION_DIR."""
+    int8_path = onnx_path.with_name(f"{onnx_path.stem}.int8.onnx")
+    if _is_fresh(int8_path, onnx_path):
+        return int8_path
+
+    try:
+        import onnxruntime
+        from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_static
+    except ImportError as exc:  # pragma: no cover - env guard
+        raise ImportError(
+            "onnxruntime is required for PLATE_DETECTOR_BACKEND=onnx-int8. "
+            "Install it with 'pip install onnxruntime'."
+        ) from exc
+
+    calibration_dir = Path(PLATE_CALIBRATION_DIR)
+    image_paths = sorted(
+        p for p in calibration_dir.glob("*") if p.suffix.lower() in {".jpg", ".jpeg", ".png"}
+    )[:PLATE_CALIBRATION_SAMPLES]
+    if not image_paths:
+        raise FileNotFoundError(
+            f"No calibration images found in {calibration_dir}. "
+            "Run scripts/prepare_indian_lp_dataset.py or set PLATE_CALIBRATION_DIR."
+        )
+
+    input_name = onnxruntime.InferenceSession(str(onnx_path)).get_inputs()[0].name
+
+    class _PlateCalibration(CalibrationDataReader):
+        def __init__(self):
+            self._paths = iter(image_paths)
+
+        def get_next(self):
+            for path in self._paths:
+                image = cv2.imread(str(path))
+                if image is not None:
+                    return {input_name: _onnx_input(image)}
+            return None
+
+    print(f"Quantising plate model to {int8_path} with {len(image_paths)} calibration images ...")
+    quantize_static(
+        str(onnx_path),
+        str(int8_path),
+        _PlateCalibration(),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=True,
+    )
+    return int8_path
+
+
+def _onnx_input(image):
+    """Letterbox a BGR image the way Ultralytics does and return a 1x3xHxW float tensor."""
+    boxed = letterbox(image, PLATE_IMGSZ)
+    rgb = cv2.cvtColor(boxed, cv2.COLOR_BGR2RGB)
+    return np.ascontiguousarray(rgb.transpose(2, 0, 1)[None], dtype=np.float32) / 255.0
+
+
+def letterbox(image, size: int, pad_value: int = 114):
+    """Resize keeping aspect ratio and pad to a size x size square."""
+    height, width = image.shape[:2]
+    scale = min(size / float(height), size / float(width))
+    new_w, new_h = max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+    resized = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+
+    top = (size - new_h) // 2
+    left = (size - new_w) // 2
+    return cv2.copyMakeBorder(
+        resized,
+        top,
+        size - new_h - top,
+        left,
+        size - new_w - left,
+        cv2.BORDER_CONSTANT,
+        value=(pad_value, pad_value, pad_value),
+    )
+
+
+def _load_model(backend: str):
+    if backend not in DETECTOR_BACKENDS:
+        raise ValueError(f"Unknown detector backend '{backend}'. Expected one of {DETECTOR_BACKENDS}.")
+    if backend == "torch":
+        return YOLO(str(_model_path))
+
+    onnx_path = _export_onnx()
+    if backend == "onnx-int8":
+        onnx_path = _quantize_int8(onnx_path)
+    return YOLO(str(onnx_path), task="detect")
+
+
+def use_backend(backend: str) -> None:
+    """Swap the active detector backend (used by the eval script to compare them)."""
+    global model, active_backend
+    model = _load_model(backend)
+    active_backend = backend
+
+
+active_backend = PLATE_DETECTOR_BACKEND
+model = _load_model(active_backend)
 
 
 def detect_plate(frame) -> List:
@@ -80,13 +207,58 @@ def detect_plate(frame) -> List:
     return contour_detect_plates(frame)
 
 
+def detect_plate_boxes(frame) -> List[Tuple[Tuple[float, float, float, float], object]]:
+    """Return (xyxy, crop) pairs so callers can track plates across frames."""
+    try:
+        results = model(frame, conf=PLATE_CONFIDENCE, imgsz=PLATE_IMGSZ, verbose=False)[0]
+    except Exception as exc:  # pragma: no cover - logging only
+        print("[YOLO ERROR]", exc)
+        results = None
+
+    detections = _detections_from_result(frame, results) if results is not None else []
+    return detections or contour_detect_plate_boxes(frame)
+
+
+def detect_plates_batch(
+    frames: Sequence,
+    batch_size: int = PLATE_BATCH_SIZE,
+    imgsz: int = PLATE_BATCH_IMGSZ,
+) -> List[List]:
+    """Return the plate crops for each frame, running YOLO on up to ``batch_size`` frames per call.
+
+    Every frame is letterboxed to an ``imgsz`` square so frames of mixed sizes share a batch.
+    """
+    batch_size = max(1, batch_size)
+    batches: List[List] = []
+    for start in range(0, len(frames), batch_size):
+        chunk = list(frames[start : start + batch_size])
+        try:
+            results = model(chunk, conf=PLATE_CONFIDENCE, imgsz=imgsz, verbose=False)
+        except Exception as exc:  # pragma: no cover - logging only
+            print("[YOLO ERROR]", exc)
+            results = [None] * len(chunk)
+
+        for frame, result in zip(chunk, results):
+            plate_boxes = _plates_from_result(frame, result) if result is not None else []
+            batches.append(plate_boxes or contour_detect_plates(frame))
+    return batches
+
+
 def _detect_with_yolo(frame) -> List:
     try:
-        results = model(frame, conf=PLATE_CONFIDENCE, verbose=False)[0]
+        results = model(frame, conf=PLATE_CONFIDENCE, imgsz=PLATE_IMGSZ, verbose=False)[0]
     except Exception as exc:  # pragma: no cover - logging only
         print("[YOLO ERROR]", exc)
         return []
 
+    return _plates_from_result(frame, results)
+
+
+def _plates_from_result(frame, results) -> List:
+    return [crop for _, crop in _detections_from_result(frame, results)]
+
+
+def _detections_from_result(frame, results) -> List:
     boxes = getattr(results, "boxes", None)
     if boxes is None or len(boxes) == 0:
         return []
@@ -117,7 +289,7 @@ def _detect_with_yolo(frame) -> List:
 
         crop = _crop(frame, xyxy, width, height, PLATE_MARGIN)
         if crop is not None:
-            plate_boxes.append(crop)
+            plate_boxes.append((tuple(xyxy), crop))
 
     return plate_boxes
 
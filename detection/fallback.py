@@ -1,5 +1,5 @@
 """Classical computer-vision fallback for license plate detection."""
-from typing import List
+from typing import List, Tuple
 
 import cv2
 import numpy as np
@@ -7,6 +7,11 @@ import numpy as np
 
 def contour_detect_plates(frame, max_results: int = 3) -> List:
     """Detect plate-shaped contours when the ML model finds nothing."""
+    return [crop for _, crop in contour_detect_plate_boxes(frame, max_results)]
+
+
+def contour_detect_plate_boxes(frame, max_results: int = 3) -> List[Tuple[Tuple[int, int, int, int], object]]:
+    """Same as contour_detect_plates, but pairs each crop with its (x1, y1, x2, y2) box."""
     if frame is None or frame.size == 0:
         return []
 
@@ -41,7 +46,7 @@ def contour_detect_plates(frame, max_results: int = 3) -> List:
         if crop.size == 0:
             continue
 
-        plates.append(crop)
+        plates.append(((x, y, x + w, y + h), crop))
         if len(plates) >= max_results:
             break
 
@@ -0,0 +1,81 @@
+"""Thin client for the persistent inference daemon."""
+
+import socket
+from threading import Lock
+from typing import List, Optional, Tuple
+
+from config import INFERENCE_SOCKET
+from inference.protocol import recv_message, send_message
+
+
+class InferenceClient:
+    """Sends detect/OCR requests to a warm daemon over a Unix socket."""
+
+    def __init__(self, socket_path: str = INFERENCE_SOCKET, timeout: Optional[float] = None):
+        self.socket_path = str(socket_path)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(self.socket_path)
+        self._lock = Lock()
+
+    def ping(self) -> bool:
+        reply, _ = self._call({"op": "ping"})
+        return bool(reply.get("ok"))
+
+    def detect_plate(self, frame) -> List:
+        _, crops = self._call({"op": "detect_plate"}, [frame])
+        return crops
+
+    def detect_plate_boxes(self, frame) -> List[Tuple]:
+        reply, crops = self._call({"op": "detect_plate_boxes"}, [frame])
+        return [(tuple(box), crop) for box, crop in zip(reply.get("boxes", []), crops)]
+
+    def detect_plates_batch(self, frames) -> List[List]:
+        frames = list(frames)
+        if not frames:
+            return []
+        reply, crops = self._call({"op": "detect_plates_batch"}, frames)
+        batches = []
+        offset = 0
+        for count in reply.get("counts", []):
+            batches.append(crops[offset : offset + count])
+            offset += count
+        return batches
+
+    def read_plate(self, plate_img):
+        return self.read_plates([plate_img])[0]
+
+    def read_plates(self, plate_imgs) -> List:
+        plate_imgs = list(plate_imgs)
+        results: List = [None] * len(plate_imgs)
+        pending = [idx for idx, img in enumerate(plate_imgs) if img is not None and img.size > 0]
+        if not pending:
+            return results
+
+        reply, _ = self._call({"op": "read_plates"}, [plate_imgs[idx] for idx in pending])
+        for idx, item in zip(pending, reply.get("results", [])):
+            results[idx] = tuple(item) if item else None
+        return results
+
+    def close(self) -> None:
+        self._sock.close()
+
+    def _call(self, header: dict, arrays: List = ()) -> tuple:
+        with self._lock:
+            send_message(self._sock, header, arrays)
+            reply, payload = recv_message(self._sock)
+        if not reply.get("ok"):
+            raise RuntimeError(f"Inference daemon error: {reply.get('error', 'unknown')}")
+        return reply, payload
+
+
+def connect(socket_path: str = INFERENCE_SOCKET) -> Optional[InferenceClient]:
+    """Return a connected client, or None when no daemon is listening."""
+    if not socket_path or not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        client = InferenceClient(socket_path)
+        client.ping()
+    except (OSError, ConnectionError, RuntimeError):
+        return None
+    return client
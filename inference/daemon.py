@@ -0,0 +1,92 @@
+"""Long-lived inference daemon that keeps YOLO and EasyOCR warm behind a Unix socket.
+
+Start it once per machine, then run main.py, main_video.py or the eval script
+as usual; they connect to INFERENCE_SOCKET and skip loading the models:
+
+    python -m inference.daemon --socket .cache/veil-inference.sock
+"""
+
+import argparse
+import os
+from pathlib import Path
+import socketserver
+from threading import Lock
+
+from config import INFERENCE_SOCKET
+from detection.detector import detect_plate, detect_plate_boxes, detect_plates_batch
+from inference.protocol import recv_message, send_message
+from ocr.plate_reader import read_plates
+
+# Both models are shared across connections; inference itself runs one request at a time
+_model_lock = Lock()
+
+
+def _dispatch(op: str, arrays: list) -> tuple:
+    if op == "ping":
+        return {"ok": True}, []
+    if op == "detect_plate":
+        with _model_lock:
+            crops = detect_plate(arrays[0])
+        return {"ok": True}, crops
+    if op == "detect_plate_boxes":
+        with _model_lock:
+            detections = detect_plate_boxes(arrays[0])
+        boxes = [[float(v) for v in box] for box, _ in detections]
+        return {"ok": True, "boxes": boxes}, [crop for _, crop in detections]
+    if op == "detect_plates_batch":
+        with _model_lock:
+            batches = detect_plates_batch(arrays)
+        crops = [crop for batch in batches for crop in batch]
+        return {"ok": True, "counts": [len(batch) for batch in batches]}, crops
+    if op == "read_plates":
+        with _model_lock:
+            results = read_plates(arrays)
+        return {"ok": True, "results": [list(result) if result else None for result in results]}, []
+    return {"ok": False, "error": f"unknown op '{op}'"}, []
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        while True:
+            try:
+                header, arrays = recv_message(self.request)
+            except (ConnectionError, OSError):
+                return
+
+            try:
+                reply, payload = _dispatch(header.get("op", ""), arrays)
+            except Exception as exc:  # pragma: no cover - reported to the client
+                reply, payload = {"ok": False, "error": str(exc)}, []
+            send_message(self.request, reply, payload)
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", default=INFERENCE_SOCKET, help="Unix socket path to listen on.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    socket_path = Path(args.socket)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        socket_path.unlink()
+
+    with _Server(str(socket_path), _Handler) as server:
+        print(f"[INFERENCE] Models loaded, listening on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if socket_path.exists():
+                os.unlink(socket_path)
+
+
+if __name__ == "__main__":
+    main()
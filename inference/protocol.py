@@ -0,0 +1,47 @@
+"""Length-prefixed JSON + raw array framing shared by the inference daemon and its clients."""
+
+import json
+import socket
+import struct
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+_HEADER = struct.Struct("!I")
+
+
+def send_message(sock: socket.socket, header: dict, arrays: Sequence = ()) -> None:
+    """Send a JSON header followed by each array's raw bytes."""
+    contiguous = [np.ascontiguousarray(array) for array in arrays]
+    header = dict(header, arrays=[{"shape": list(a.shape), "dtype": a.dtype.str} for a in contiguous])
+    encoded = json.dumps(header).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(encoded)) + encoded)
+    for array in contiguous:
+        if array.nbytes:
+            sock.sendall(memoryview(array).cast("B"))
+
+
+def recv_message(sock: socket.socket) -> Tuple[dict, List]:
+    """Receive one message; raises ConnectionError when the peer has closed the socket."""
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    header = json.loads(_recv_exact(sock, size).decode("utf-8"))
+
+    arrays = []
+    for spec in header.pop("arrays", []):
+        dtype = np.dtype(spec["dtype"])
+        shape = tuple(spec["shape"])
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        arrays.append(np.frombuffer(_recv_exact(sock, nbytes), dtype=dtype).reshape(shape))
+    return header, arrays
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytearray:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:], size - received)
+        if count == 0:
+            raise ConnectionError("Inference socket closed mid-message.")
+        received += count
+    return buffer
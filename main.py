@@ -1,37 +1,93 @@
 import cv2
 
-from config import CAMERA_SOURCE, CLOUD_ENABLED
+from config import (
+    CAMERA_SOURCE,
+    CAMERA_SOURCES,
+    CLOUD_ENABLED,
+    MOTION_GATE_ENABLED,
+    OCR_WORKERS,
+    PIPELINE_MODE,
+    TRACKER_ENABLED,
+)
 from cloud.sync_worker import sync_pending
 from db.database import init_db
+from db.writer import shutdown_writer
+from detection.motion import MotionGate
+from ocr.plate_cache import PlateReadCache
+from ocr.worker_pool import OcrWorkerPool
+from pipeline.capture import LatestFrameCapture, is_file_source
 from pipeline.frame_processor import process_frame
+from pipeline.multi_camera import run_multi_camera
+from pipeline.staged import StagedPipeline
+from tracking.box_tracker import PlateTracker
+from tracking.entry_exit import restore_open_sessions
+from tracking.plate_confirmer import default_votes
 
 
-def run_camera() -> None:
-    cap = cv2.VideoCapture(CAMERA_SOURCE)
-    if not cap.isOpened():
-        raise RuntimeError("Unable to access camera source. Check CAMERA_SOURCE in config.py")
+def run_camera(source=CAMERA_SOURCE) -> None:
+    capture = LatestFrameCapture(source, drop_stale=not is_file_source(source))
+    ocr_pool = OcrWorkerPool() if OCR_WORKERS > 0 else None
+    motion_gate = MotionGate() if MOTION_GATE_ENABLED else None
+    staged = StagedPipeline(ocr_pool=ocr_pool) if PIPELINE_MODE == "staged" else None
+    # The staged pipeline detects frames concurrently, so box tracking only applies to the sequential loop
+    tracker = PlateTracker() if TRACKER_ENABLED and staged is None else None
+    # Tracked and staged runs skip or cache OCR per track / per pipeline themselves
+    read_cache = PlateReadCache() if staged is None and tracker is None else None
 
     try:
         while True:
-            ret, frame = cap.read()
-            if not ret:
+            frame = capture.read()
+            if frame is None:
                 break
 
-            process_frame(frame)
+            if motion_gate is None or motion_gate.should_process(frame):
+                if staged is not None:
+                    staged.submit(frame)
+                else:
+                    process_frame(frame, ocr_pool=ocr_pool, tracker=tracker, read_cache=read_cache)
 
             cv2.imshow("VEIL", frame)
             if cv2.waitKey(1) == 27:  # ESC to quit
                 break
     finally:
-        cap.release()
+        capture.release()
         cv2.destroyAllWindows()
+        if staged is not None:
+            staged.close()
+            print("[PIPELINE]", staged.stats())
+        if ocr_pool is not None:
+            ocr_pool.shutdown()
+        if tracker is not None:
+            print("[TRACKER]", tracker.stats())
+        print("[CAPTURE]", capture.stats())
+        print("[VOTES]", default_votes.stats())
+        if read_cache is not None:
+            print("[OCR CACHE]", read_cache.stats())
+
+
+def run_cameras(sources) -> None:
+    ocr_pool = OcrWorkerPool() if OCR_WORKERS > 0 else None
+    try:
+        stats = run_multi_camera(sources, ocr_pool=ocr_pool)
+    finally:
+        if ocr_pool is not None:
+            ocr_pool.shutdown()
+    for source, capture_stats in stats.items():
+        print(f"[CAPTURE {source}]", capture_stats)
 
 
 def main() -> None:
     init_db()
-    run_camera()
-    if CLOUD_ENABLED:
-        sync_pending()
+    restore_open_sessions()
+    try:
+        if len(CAMERA_SOURCES) > 1:
+            run_cameras(CAMERA_SOURCES)
+        else:
+            run_camera(CAMERA_SOURCES[0])
+        if CLOUD_ENABLED:
+            sync_pending()
+    finally:
+        shutdown_writer()
 
 
 if __name__ == "__main__":
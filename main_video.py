@@ -1,7 +1,9 @@
+from itertools import islice
 from pathlib import Path
+import time
+from typing import Iterable, Iterator, List
 import warnings
 
-import cv2
 warnings.filterwarnings(
     "ignore",
     message=".*'pin_memory' argument is set as true but no accelerator is found.*",
@@ -9,40 +11,64 @@ warnings.filterwarnings(
     module="torch.utils.data.dataloader",
 )
 
-from config import CLOUD_ENABLED
+from config import CLOUD_ENABLED, IMAGE_LOADER_WORKERS, IMAGE_PREFETCH, PLATE_BATCH_SIZE
 from cloud.sync_worker import sync_pending
 from db.database import init_db
-from pipeline.frame_processor import process_frame
+from db.writer import shutdown_writer
+from pipeline.backend import detect_plates_batch
+from pipeline.frame_processor import handle_readings, recognize_plates
+from pipeline.image_loader import PrefetchingImageLoader
+from tracking.entry_exit import restore_open_sessions
 
 IMAGE_DIR = Path("data/images")
 
 
-def process_images(image_dir: Path = IMAGE_DIR) -> None:
+def process_images(
+    image_dir: Path = IMAGE_DIR,
+    batch_size: int = PLATE_BATCH_SIZE,
+    workers: int = IMAGE_LOADER_WORKERS,
+    prefetch: int = IMAGE_PREFETCH,
+) -> None:
     image_dir = Path(image_dir)
     if not image_dir.exists():
         raise FileNotFoundError(f"Image directory not found: {image_dir}")
 
-    image_paths = sorted(p for p in image_dir.iterdir() if p.is_file())
-    if not image_paths:
+    # Keep at least one full detector batch decoded ahead
+    loader = PrefetchingImageLoader(image_dir, workers, max(prefetch, batch_size))
+    inference_seconds = 0.0
+    for batch in _batched(loader, batch_size):
+        started = time.perf_counter()
+        frames = [frame for _, frame in batch]
+        for frame, plates in zip(frames, detect_plates_batch(frames)):
+            handle_readings(plates, recognize_plates(plates), min_plate_hits=1)
+        inference_seconds += time.perf_counter() - started
+
+    if not loader.loaded and not loader.skipped:
         print(f"No images found in {image_dir}.")
         return
 
-    for image_path in image_paths:
-        frame = cv2.imread(str(image_path))
-        if frame is None:
-            print(f"Skipping unreadable image: {image_path}")
-            continue
+    print("Image processing finished.")
+    print("[LOADER]", {**loader.stats(), "inference_s": round(inference_seconds, 3)})
 
-        process_frame(frame, min_plate_hits=1)
 
-    print("Image processing finished.")
+def _batched(items: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, max(1, size)))
+        if not batch:
+            return
+        yield batch
 
 
 def main() -> None:
     init_db()
-    process_images()
-    if CLOUD_ENABLED:
-        sync_pending()
+    restore_open_sessions()
+    try:
+        process_images()
+        if CLOUD_ENABLED:
+            sync_pending()
+    finally:
+        shutdown_writer()
 
 
 if __name__ == "__main__":
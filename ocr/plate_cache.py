@@ -0,0 +1,128 @@
+"""Per-source cache that reuses OCR results for repeat crops of an already confirmed plate."""
+
+from collections import OrderedDict
+from itertools import count
+from threading import Lock
+import time
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from config import OCR_CACHE_MIN_SIMILARITY, OCR_CACHE_SIZE, OCR_CACHE_TTL_SECONDS
+
+THUMB_SIZE = (128, 32)  # width, height of the blurred grayscale copy that is compared
+ALIGN_SHIFT = (4, 2)  # pixels of x/y drift absorbed before comparing
+STRIPS = 12  # vertical strips, each about one character wide on a 10-character plate
+
+
+class CachedRead(tuple):
+    """A (text, confidence) result replayed from the cache; it repeats an earlier reading, so it is no new vote."""
+
+    __slots__ = ()
+
+
+def is_cached(result) -> bool:
+    return isinstance(result, CachedRead)
+
+
+def thumbnail(img) -> np.ndarray:
+    """Blurred, fixed-size grayscale copy of a crop; blurring keeps sensor noise out of the comparison."""
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img
+    small = cv2.resize(gray, THUMB_SIZE, interpolation=cv2.INTER_AREA).astype(np.float32)
+    return cv2.GaussianBlur(small, (3, 3), 0)
+
+
+def similarity(stored: np.ndarray, candidate: np.ndarray) -> float:
+    """Worst per-strip correlation after aligning ``candidate`` onto ``stored``.
+
+    Each strip is correlated on its own (zero mean, unit norm), so brightness and
+    contrast drop out, while one changed character pulls its strip far below a
+    repeat of the same plate.
+    """
+    shift_x, shift_y = ALIGN_SHIFT
+    core = stored[shift_y : stored.shape[0] - shift_y, shift_x : stored.shape[1] - shift_x]
+    _, _, _, (x, y) = cv2.minMaxLoc(cv2.matchTemplate(candidate, core, cv2.TM_CCOEFF_NORMED))
+    aligned = candidate[y : y + core.shape[0], x : x + core.shape[1]]
+
+    width = core.shape[1] // STRIPS
+    rows = core.shape[0]
+    a = core[:, : width * STRIPS].reshape(rows, STRIPS, width).transpose(1, 0, 2).reshape(STRIPS, -1)
+    b = aligned[:, : width * STRIPS].reshape(rows, STRIPS, width).transpose(1, 0, 2).reshape(STRIPS, -1)
+    a = a - a.mean(axis=1, keepdims=True)
+    b = b - b.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+    # Blank strips (plate margins) carry no evidence either way
+    scores = np.where(norms > 1e-6, (a * b).sum(axis=1) / np.maximum(norms, 1e-6), 1.0)
+    return float(scores.min())
+
+
+class PlateReadCache:
+    """Bounded LRU of recent crops -> (text, confidence) for one camera source, with a TTL.
+
+    A lookup only hits when every strip of the crop matches a stored crop at
+    ``min_similarity`` or better, so a plate one character away from a cached
+    one is read afresh. Callers store only readings of confirmed plates, which
+    keeps unconfirmed plates on fresh OCR.
+    """
+
+    def __init__(
+        self,
+        max_size: int = OCR_CACHE_SIZE,
+        ttl_seconds: float = OCR_CACHE_TTL_SECONDS,
+        min_similarity: float = OCR_CACHE_MIN_SIMILARITY,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.min_similarity = min_similarity
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, Tuple[float, np.ndarray, Tuple[str, float]]]" = OrderedDict()
+        self._ids = count()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def lookup(self, img) -> Optional[CachedRead]:
+        if not self.enabled or img is None or img.size == 0:
+            return None
+
+        thumb = thumbnail(img)
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            for key in reversed(self._entries):
+                _, stored, result = self._entries[key]
+                if similarity(stored, thumb) >= self.min_similarity:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return CachedRead(result)
+            self.misses += 1
+            return None
+
+    def store(self, img, result: Tuple[str, float]) -> None:
+        if not self.enabled or img is None or img.size == 0:
+            return
+
+        thumb = thumbnail(img)
+        with self._lock:
+            self._entries[next(self._ids)] = (time.monotonic(), thumb, tuple(result))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def _expire(self, now: float) -> None:
+        stale = [key for key, (created, _, _) in self._entries.items() if now - created > self.ttl_seconds]
+        for key in stale:
+            del self._entries[key]
@@ -1,15 +1,22 @@
 """OCR helpers for extracting reliable plate strings from cropped regions."""
 
-from collections import deque
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import islice
+import math
 import re
-from typing import Iterable, List
+from typing import Dict, Iterable, Iterator, List
 
 import cv2
 import easyocr
+import numpy as np
 
 from config import (
     MIN_OCR_CONFIDENCE,
     MIN_PLATE_LENGTH,
+    OCR_EARLY_EXIT_AGREEMENT,
+    OCR_EARLY_EXIT_CONFIDENCE,
+    OCR_VARIANT_WAVE,
     PLATE_MAX_LENGTH,
     PLATE_MIN_DIGITS,
     PLATE_REGEX,
@@ -20,13 +27,14 @@ reader = easyocr.Reader(['en'], gpu=False)
 PLATE_PATTERN = re.compile(PLATE_REGEX) if PLATE_REGEX else None
 PLATE_GROUP_PATTERN = re.compile(r"^([A-Z]{2})([0-9]{1,2})([A-Z]{1,3})([0-9]{3,4})$") if PLATE_REGEX else None
 ALLOWLIST = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-FAST_VARIANT_COUNT = 2
 MAX_VALID_CANDIDATES = 8
 MIN_VARIANT_DIM = 96
 MAX_VARIANT_DIM = 320
+MIN_BOX_DIM = 4
 LINE_GAP_FRACTION = 0.2
 PARAGRAPH_FALLBACK_CONF = 0.45
-ROTATION_ANGLES = (-15, -10, -5, 5, 10, 15)
+DESKEW_MAX_ANGLE = 15.0
+DESKEW_MIN_ANGLE = 1.0
 LOW_CONFIDENCE_FLOOR = max(0.2, MIN_OCR_CONFIDENCE - 0.2)
 NOISE_TOKENS = (
     "INDIAN",
@@ -118,6 +126,20 @@ SERIES_CHAR_OPTIONS = {
     "8": ["B"],
     "9": ["G"],
 }
+MAX_CORRECTIONS = 4
+# name, min length, max length, digits (True) or letters (False)
+PLATE_SEGMENTS = (
+    ("state", 2, 2, False),
+    ("district", 1, 2, True),
+    ("series", 1, 3, False),
+    ("number", 3, 4, True),
+)
+DISTRICT_SEGMENT = 1
+SERIES_SEGMENT = 2
+# Weights mirror the ordering of the first three fields of _candidate_score
+STATE_SCORE = 100
+DISTRICT_SCORE = 10
+SERIES_SCORE = 1
 NUMBER_CHAR_FIX = {
     "O": "0",
     "D": "0",
@@ -167,40 +189,142 @@ def _sharpen(gray):
     return cv2.addWeighted(gray, 1.5, blurred, -0.5, 0)
 
 
-def _preprocess_variants(plate_img) -> List:
+def _iter_variants(plate_img) -> Iterator[tuple]:
+    """Yield (variant, text boxes) pairs lazily so callers can stop once a read is trusted."""
     scaled = _scale_variant(plate_img)
+    boxes = _detect_text_boxes(scaled)
+    for base, angle in _iter_bases(scaled):
+        base_boxes = _rotate_boxes(boxes, angle, base.shape) if angle else boxes
+        for variant in _filter_variants(base):
+            yield variant, base_boxes
 
-    variants: List = []
-    bases = [scaled] + [_rotate(scaled, ang) for ang in ROTATION_ANGLES]
-
-    for base in bases:
-        gray = cv2.cvtColor(base, cv2.COLOR_BGR2GRAY)
-        gray = cv2.bilateralFilter(gray, 9, 17, 17)
-        sharp = _sharpen(gray)
-
-        adaptive = cv2.adaptiveThreshold(
-            gray,
-            255,
-            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-            cv2.THRESH_BINARY,
-            31,
-            2,
-        )
 
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(gray)
-        inverted = cv2.bitwise_not(adaptive)
-        morph_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-        closed = cv2.morphologyEx(adaptive, cv2.MORPH_CLOSE, morph_kernel)
+def _iter_bases(scaled) -> Iterator[tuple]:
+    angle = _estimate_skew(scaled)
+    if abs(angle) < DESKEW_MIN_ANGLE:
+        yield scaled, 0
+        return
 
-        variants.extend([gray, sharp, adaptive, inverted, clahe, closed])
+    # The undeskewed crop is the single neighbour, so a bad estimate never hides the original view
+    yield _rotate(scaled, angle), angle
+    yield scaled, 0
 
-    return variants
+
+def _estimate_skew(img) -> float:
+    """Return the rotation (degrees, for _rotate) that levels the dominant near-horizontal lines."""
+    height, width = img.shape[:2]
+    if height == 0 or width == 0:
+        return 0.0
+
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img
+    edges = cv2.Canny(gray, 50, 150)
+    lines = cv2.HoughLinesP(
+        edges,
+        1,
+        np.pi / 180,
+        threshold=max(20, width // 4),
+        minLineLength=max(10, width // 3),
+        maxLineGap=max(4, width // 40),
+    )
+    if lines is None:
+        return 0.0
+
+    angles = []
+    for x1, y1, x2, y2 in lines.reshape(-1, 4):
+        angle = math.degrees(math.atan2(y2 - y1, x2 - x1))
+        if angle > 90:
+            angle -= 180
+        elif angle < -90:
+            angle += 180
+        if abs(angle) <= DESKEW_MAX_ANGLE:
+            angles.append(angle)
+
+    if not angles:
+        return 0.0
+    return float(np.median(angles))
+
+
+def _detect_text_boxes(img) -> List[List[int]]:
+    """Run the text detector once per crop and return [x_min, x_max, y_min, y_max] boxes."""
+    height, width = img.shape[:2]
+    full_frame = [[0, width, 0, height]]
+    try:
+        horizontal_agg, free_agg = reader.detect(img)
+    except Exception as exc:  # pragma: no cover - logging only
+        print("[OCR DETECT ERROR]", exc)
+        return full_frame
+
+    horizontal = horizontal_agg[0] if horizontal_agg else []
+    free = free_agg[0] if free_agg else []
+
+    boxes = [list(box) for box in horizontal]
+    for points in free:
+        xs = [pt[0] for pt in points]
+        ys = [pt[1] for pt in points]
+        boxes.append([min(xs), max(xs), min(ys), max(ys)])
+
+    clipped = [_clip_box(box, width, height) for box in boxes]
+    clipped = [box for box in clipped if box]
+    return clipped or full_frame
+
+
+def _rotate_boxes(boxes: List[List[int]], angle: float, shape) -> List[List[int]]:
+    h, w = shape[:2]
+    mat = cv2.getRotationMatrix2D((w // 2, h // 2), angle, 1.0)
+    rotated = []
+    for x_min, x_max, y_min, y_max in boxes:
+        corners = np.array(
+            [[x_min, y_min, 1.0], [x_max, y_min, 1.0], [x_max, y_max, 1.0], [x_min, y_max, 1.0]]
+        )
+        moved = corners @ mat.T
+        box = _clip_box(
+            [moved[:, 0].min(), moved[:, 0].max(), moved[:, 1].min(), moved[:, 1].max()],
+            w,
+            h,
+        )
+        if box:
+            rotated.append(box)
+    return rotated or [[0, w, 0, h]]
+
+
+def _clip_box(box, width: int, height: int) -> List[int] | None:
+    x_min, x_max, y_min, y_max = box
+    x_min = max(0, min(width, int(x_min)))
+    x_max = max(0, min(width, int(round(x_max))))
+    y_min = max(0, min(height, int(y_min)))
+    y_max = max(0, min(height, int(round(y_max))))
+    if x_max - x_min < MIN_BOX_DIM or y_max - y_min < MIN_BOX_DIM:
+        return None
+    return [x_min, x_max, y_min, y_max]
+
+
+def _filter_variants(base) -> Iterator:
+    gray = cv2.cvtColor(base, cv2.COLOR_BGR2GRAY)
+    gray = cv2.bilateralFilter(gray, 9, 17, 17)
+    yield gray
+    yield _sharpen(gray)
+
+    adaptive = cv2.adaptiveThreshold(
+        gray,
+        255,
+        cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        cv2.THRESH_BINARY,
+        31,
+        2,
+    )
+    yield adaptive
+    yield cv2.bitwise_not(adaptive)
+    yield cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(gray)
+
+    morph_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+    yield cv2.morphologyEx(adaptive, cv2.MORPH_CLOSE, morph_kernel)
 
 
 def _clean_text(text: str) -> str:
     return re.sub(r"[^A-Z0-9]", "", text.upper())
 
 
+@lru_cache(maxsize=4096)
 def _post_correct(text: str) -> str:
     if not PLATE_PATTERN:
         return text
@@ -252,44 +376,133 @@ def _seed_priority(text: str) -> tuple:
 
 
 def _match_with_substitutions(seeds: List[str]) -> str | None:
-    queue = deque()
-    seen = set()
+    best_match = None
+    best_key = None
 
     for seed in seeds:
-        if seed in seen:
+        correction = _best_correction(seed)
+        if not correction:
+            continue
+        candidate, score, corrections = correction
+        if not PLATE_PATTERN.fullmatch(candidate):
             continue
-        seen.add(seed)
-        queue.append((seed, 0))
+        key = (score, -abs(len(candidate) - 10), -corrections)
+        if best_key is None or key > best_key:
+            best_match = candidate
+            best_key = key
 
-    best_match = None
-    best_score = None
-    max_depth = 4
+    return best_match
 
-    while queue:
-        current, depth = queue.popleft()
 
-        matched = bool(PLATE_PATTERN.fullmatch(current))
-        if matched:
-            score = (_candidate_score(current, 1.0), -depth)
-            if best_score is None or score > best_score:
-                best_match = current
-                best_score = score
+@lru_cache(maxsize=4096)
+def _best_correction(seed: str) -> tuple[str, int, int] | None:
+    """Rewrite ``seed`` into the plate grammar with a single left-to-right lattice pass.
 
-        if depth >= max_depth:
-            continue
+    Each lattice cell is (segment, characters consumed in it, corrections used)
+    and keeps the best grammar score reaching it, so the cost is linear in the
+    seed length instead of exponential in the substitution depth.
+    """
+    min_length = sum(segment[1] for segment in PLATE_SEGMENTS)
+    max_length = sum(segment[2] for segment in PLATE_SEGMENTS)
+    if not min_length <= len(seed) <= max_length:
+        return None
 
-        for idx, ch in enumerate(current):
-            replacements = SUBSTITUTIONS.get(ch, [])
-            if not replacements:
+    layer: Dict[tuple, tuple] = {}
+    for first, first_cost in _char_options(seed[0], 0).items():
+        for second, second_cost in _char_options(seed[1], 0).items():
+            corrections = first_cost + second_cost
+            if corrections > MAX_CORRECTIONS:
                 continue
-            for replacement in replacements:
-                candidate = current[:idx] + replacement + current[idx + 1 :]
-                if candidate in seen:
-                    continue
-                seen.add(candidate)
-                queue.append((candidate, depth + 1))
+            cell = (0, 2, corrections)
+            score = STATE_SCORE if first + second in STATE_PREFIXES else 0
+            if cell not in layer or score > layer[cell][0]:
+                layer[cell] = (score, None, first + second)
+    layers = [layer]
+
+    for ch in seed[2:]:
+        next_layer: Dict[tuple, tuple] = {}
+        for (segment, count, corrections), (score, _, _) in layer.items():
+            for next_segment, next_count, bonus in _segment_steps(segment, count):
+                for target, cost in _char_options(ch, next_segment).items():
+                    total = corrections + cost
+                    if total > MAX_CORRECTIONS:
+                        continue
+                    cell = (next_segment, next_count, total)
+                    value = score + bonus
+                    if cell not in next_layer or value > next_layer[cell][0]:
+                        next_layer[cell] = (value, (segment, count, corrections), target)
+        if not next_layer:
+            return None
+        layers.append(next_layer)
+        layer = next_layer
+
+    last_segment = len(PLATE_SEGMENTS) - 1
+    best_cell = None
+    best_key = None
+    for cell, (score, _, _) in layer.items():
+        segment, count, corrections = cell
+        if segment != last_segment or count < PLATE_SEGMENTS[segment][1]:
+            continue
+        key = (score, -corrections)
+        if best_key is None or key > best_key:
+            best_cell = cell
+            best_key = key
 
-    return best_match
+    if best_cell is None:
+        return None
+
+    chars = []
+    cell = best_cell
+    for step in reversed(layers):
+        _, previous, text = step[cell]
+        chars.append(text)
+        cell = previous
+    return "".join(reversed(chars)), best_key[0], -best_key[1]
+
+
+@lru_cache(maxsize=None)
+def _segment_steps(segment: int, count: int) -> tuple:
+    _, min_length, max_length, _ = PLATE_SEGMENTS[segment]
+    steps = []
+    if count < max_length:
+        steps.append((segment, count + 1, 0))
+    if count >= min_length and segment + 1 < len(PLATE_SEGMENTS):
+        bonus = 0
+        if segment == DISTRICT_SEGMENT and count == 2:
+            bonus = DISTRICT_SCORE
+        elif segment == SERIES_SEGMENT and count <= 2:
+            bonus = SERIES_SCORE
+        steps.append((segment + 1, 1, bonus))
+    return tuple(steps)
+
+
+@lru_cache(maxsize=None)
+def _char_options(ch: str, segment: int) -> Dict[str, int]:
+    """Characters ``ch`` may be read as in ``segment``, mapped to their correction cost."""
+    costs = {ch: 0}
+    frontier = [ch]
+    for depth in range(1, MAX_CORRECTIONS + 1):
+        next_frontier = []
+        for current in frontier:
+            for replacement in SUBSTITUTIONS.get(current, []):
+                if replacement not in costs:
+                    costs[replacement] = depth
+                    next_frontier.append(replacement)
+        frontier = next_frontier
+
+    wants_digit = PLATE_SEGMENTS[segment][3]
+    if wants_digit and ch in NUMBER_CHAR_FIX:
+        costs[NUMBER_CHAR_FIX[ch]] = min(1, costs.get(NUMBER_CHAR_FIX[ch], 1))
+    if segment == SERIES_SEGMENT:
+        for option in SERIES_CHAR_OPTIONS.get(ch, []):
+            costs[option] = min(1, costs.get(option, 1))
+
+    allowed = {
+        target: cost
+        for target, cost in costs.items()
+        if (target.isdigit() if wants_digit else target.isalpha())
+    }
+    return dict(sorted(allowed.items(), key=lambda item: item[1]))
 
 
 def _enforce_state_prefix(text: str) -> str:
@@ -447,11 +660,61 @@ def _basic_plate_heuristics(text: str, digit_count: int) -> bool:
     return prefix_letters or suffix_digits
 
 
-def _read_variant(img) -> List[tuple[float, str]]:
+def _recognize_batch(items: List[tuple]) -> List[List[tuple[float, str]]]:
+    """Recognise every (variant, boxes) pair with one ``reader.recognize`` call.
+
+    Variants are stacked vertically on one canvas and their detector boxes are
+    offset into it, so the CRAFT text detector never runs. On CPU EasyOCR still
+    recognises the boxes one at a time; skipping CRAFT is where the time goes.
+    """
+    if not items:
+        return []
+
+    canvas, offsets, horizontal = _tile_variants(items)
+    try:
+        results = reader.recognize(
+            canvas,
+            horizontal_list=horizontal,
+            free_list=[],
+            detail=1,
+            allowlist=ALLOWLIST,
+        )
+    except Exception as exc:  # pragma: no cover - logging only
+        print("[OCR ERROR]", exc)
+        return [[] for _ in items]
+
+    grouped: List[List[tuple]] = [[] for _ in items]
+    for bbox, text, conf in results:
+        top = min(pt[1] for pt in bbox)
+        idx = max(0, bisect_right(offsets, top) - 1)
+        local = [[pt[0], pt[1] - offsets[idx]] for pt in bbox]
+        grouped[idx].append((local, text, conf))
+
+    return [_parse_hits(group, items[idx][0].shape[0]) for idx, group in enumerate(grouped)]
+
+
+def _tile_variants(items: List[tuple]):
+    width = max(img.shape[1] for img, _ in items)
+    height = sum(img.shape[0] for img, _ in items)
+    canvas = np.zeros((height, width), dtype=np.uint8)
+
+    offsets: List[int] = []
+    horizontal: List[List[int]] = []
+    top = 0
+    for img, boxes in items:
+        h, w = img.shape[:2]
+        canvas[top : top + h, :w] = img
+        offsets.append(top)
+        for x_min, x_max, y_min, y_max in boxes:
+            horizontal.append([x_min, x_max, y_min + top, y_max + top])
+        top += h
+
+    return canvas, offsets, horizontal
+
+
+def _parse_hits(results: List[tuple], height: int) -> List[tuple[float, str]]:
     hits: List[tuple[float, str]] = []
     line_entries: List[dict] = []
-    results = reader.readtext(img, detail=1, allowlist=ALLOWLIST)
-    height = img.shape[0] if len(img.shape) > 1 else 0
     line_gap = max(12.0, height * LINE_GAP_FRACTION)
 
     for bbox, text, conf in results:
@@ -476,16 +739,20 @@ def _read_variant(img) -> List[tuple[float, str]]:
 
     hits.extend(_merge_multiline(line_entries, line_gap))
 
-    # Skip paragraph-mode fallback when strict regex is required to avoid loose text
+    # Skip paragraph-style fallback when strict regex is required to avoid loose text
     if not PLATE_REQUIRE_REGEX:
-        for text in reader.readtext(img, detail=0, paragraph=True):
-            cleaned = _clean_text(text)
-            if cleaned:
-                hits.append((PARAGRAPH_FALLBACK_CONF, cleaned))
+        paragraph = _paragraph_text(line_entries, line_gap)
+        if paragraph:
+            hits.append((PARAGRAPH_FALLBACK_CONF, paragraph))
 
     return sorted(hits, key=lambda item: item[0], reverse=True)
 
 
+def _paragraph_text(entries: List[dict], line_gap: float) -> str:
+    ordered = sorted(entries, key=lambda item: (round(item["y"] / line_gap), item["x"]))
+    return "".join(item["text"] for item in ordered)
+
+
 def _merge_multiline(entries: List[dict], line_gap: float) -> List[tuple[float, str]]:
     if len(entries) < 2:
         return []
@@ -521,43 +788,72 @@ def _merge_multiline(entries: List[dict], line_gap: float) -> List[tuple[float,
     return [(merged_conf, top_text + bottom_text)]
 
 
-def _evaluate_variants(variants: List) -> tuple[List[tuple[float, str]], List[tuple[float, str]]]:
-    valid: List[tuple[float, str]] = []
-    collected: List[tuple[float, str]] = []
+class _CandidatePool:
+    """Collects OCR hits for one crop until enough variants agree on a plate."""
 
-    for img in variants:
-        hits = _read_variant(img)
-        if not hits:
-            continue
+    def __init__(self, variants: Iterator[tuple]):
+        self._variants = variants
+        self._agreement: Dict[str, List[float]] = {}
+        self.valid: List[tuple[float, str]] = []
+        self.collected: List[tuple[float, str]] = []
+        self.done = False
 
-        collected.extend(hits)
-        variant_valid = [hit for hit in hits if _valid_candidate(hit[1])]
-        if variant_valid:
-            valid.extend(variant_valid)
-            if len(valid) >= MAX_VALID_CANDIDATES:
-                break
+    def next_wave(self, size: int) -> List[tuple]:
+        if self.done:
+            return []
+        wave = list(islice(self._variants, size)) if size > 0 else list(self._variants)
+        if not wave:
+            self.done = True
+        return wave
 
-    return valid, collected
+    def add_hits(self, hits: List[tuple[float, str]]) -> None:
+        if self.done or not hits:
+            return
 
+        self.collected.extend(hits)
+        variant_valid = [hit for hit in hits if _valid_candidate(hit[1])]
+        if not variant_valid:
+            return
+
+        self.valid.extend(variant_valid)
+        if len(self.valid) >= MAX_VALID_CANDIDATES or self._record_agreement(variant_valid):
+            self.done = True
+
+    def candidates(self) -> List[tuple[float, str]]:
+        if self.valid:
+            return self.valid[:MAX_VALID_CANDIDATES]
+        return self.collected
+
+    def _record_agreement(self, variant_valid: List[tuple[float, str]]) -> bool:
+        best_per_text: Dict[str, float] = {}
+        for conf, text in variant_valid:
+            best_per_text[text] = max(conf, best_per_text.get(text, 0.0))
+
+        for text, conf in best_per_text.items():
+            votes = self._agreement.setdefault(text, [])
+            votes.append(conf)
+            if len(votes) >= OCR_EARLY_EXIT_AGREEMENT and max(votes) >= OCR_EARLY_EXIT_CONFIDENCE:
+                return True
+        return False
 
-def _read_candidates(images: Iterable) -> List:
-    variants = list(images)
-    fast_variants = variants[:FAST_VARIANT_COUNT]
-    slow_variants = variants[FAST_VARIANT_COUNT:]
 
-    valid, collected = _evaluate_variants(fast_variants)
-    slow_valid: List[tuple[float, str]] = []
-    slow_collected: List[tuple[float, str]] = []
+def _read_candidates(plate_imgs: List) -> List[List[tuple[float, str]]]:
+    pools = [_CandidatePool(_iter_variants(img)) for img in plate_imgs]
 
-    if len(valid) < MAX_VALID_CANDIDATES and slow_variants:
-        slow_valid, slow_collected = _evaluate_variants(slow_variants)
-        collected.extend(slow_collected)
-        valid.extend(slow_valid)
+    while True:
+        wave: List[tuple] = []
+        owners: List[_CandidatePool] = []
+        for pool in pools:
+            for item in pool.next_wave(OCR_VARIANT_WAVE):
+                wave.append(item)
+                owners.append(pool)
+        if not wave:
+            break
 
-    if valid:
-        return valid[:MAX_VALID_CANDIDATES]
+        for pool, hits in zip(owners, _recognize_batch(wave)):
+            pool.add_hits(hits)
 
-    return collected
+    return [pool.candidates() for pool in pools]
 
 
 def _select_best(candidates: List[tuple[float, str]]):
@@ -596,12 +892,24 @@ def _combine_candidates(candidates: List[tuple[float, str]]):
 
 
 def read_plate(plate_img):
-    if plate_img is None or plate_img.size == 0:
-        return None
+    return read_plates([plate_img])[0]
+
+
+def read_plates(plate_imgs: Iterable) -> List[tuple[str, float] | None]:
+    """Read every crop of a frame, sharing recognizer batches across crops."""
+    plate_imgs = list(plate_imgs)
+    results: List[tuple[str, float] | None] = [None] * len(plate_imgs)
+    pending = [idx for idx, img in enumerate(plate_imgs) if img is not None and img.size > 0]
+    if not pending:
+        return results
+
+    candidate_lists = _read_candidates([plate_imgs[idx] for idx in pending])
+    for idx, candidates in zip(pending, candidate_lists):
+        results[idx] = _choose_result(candidates)
+    return results
 
-    variants = _preprocess_variants(plate_img)
-    candidates = _read_candidates(variants)
 
+def _choose_result(candidates: List[tuple[float, str]]) -> tuple[str, float] | None:
     filtered = [c for c in candidates if _valid_candidate(c[1])]
     choice = _select_best(filtered) if filtered else None
     combined = None
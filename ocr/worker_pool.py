@@ -0,0 +1,154 @@
+"""Process pool that spreads OCR across cores, one EasyOCR reader per worker."""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+import multiprocessing
+from threading import Condition
+from typing import Deque, Dict, Iterable, List
+
+from config import OCR_MAX_BATCH, OCR_QUEUE_POLICY, OCR_QUEUE_SIZE, OCR_WORKERS
+
+QUEUE_POLICIES = ("block", "drop", "merge")
+
+
+def _init_worker() -> None:
+    # Importing the reader module loads this worker's own EasyOCR model once
+    import ocr.plate_reader  # noqa: F401
+
+
+def _read_batch(plate_imgs: List) -> List:
+    from ocr.plate_reader import read_plates
+
+    return read_plates(plate_imgs)
+
+
+class _Batch:
+    __slots__ = ("crops", "futures")
+
+    def __init__(self):
+        self.crops: List = []
+        self.futures: List[Future] = []
+
+    def add(self, plate_img, future: Future) -> None:
+        self.crops.append(plate_img)
+        self.futures.append(future)
+
+
+class OcrWorkerPool:
+    """Bounded queue of OCR jobs feeding N reader processes.
+
+    When ``max_queue`` batches are already waiting, ``policy`` decides what
+    happens to a new crop: ``block`` waits for room, ``drop`` resolves it to
+    None straight away and ``merge`` appends it to the newest waiting batch
+    (up to ``max_batch`` crops) so it rides along in the same recognizer call.
+    """
+
+    def __init__(
+        self,
+        workers: int = OCR_WORKERS,
+        max_queue: int = OCR_QUEUE_SIZE,
+        policy: str = OCR_QUEUE_POLICY,
+        max_batch: int = OCR_MAX_BATCH,
+    ):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unknown OCR queue policy '{policy}'. Expected one of {QUEUE_POLICIES}.")
+
+        self.workers = max(1, workers)
+        self.max_queue = max(1, max_queue)
+        self.policy = policy
+        self.max_batch = max(1, max_batch)
+        self.submitted = 0
+        self.dropped = 0
+        self.merged = 0
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        self._pending: Deque[_Batch] = deque()
+        self._in_flight = 0
+        self._closed = False
+        self._cond = Condition()
+
+    def submit(self, plate_img) -> Future:
+        """Queue one crop and return a future resolving to read_plate's result."""
+        future: Future = Future()
+        if plate_img is None or plate_img.size == 0:
+            future.set_result(None)
+            return future
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("OCR worker pool is shut down.")
+            self.submitted += 1
+
+            if len(self._pending) >= self.max_queue:
+                if self.policy == "merge" and len(self._pending[-1].crops) < self.max_batch:
+                    self._pending[-1].add(plate_img, future)
+                    self.merged += 1
+                    return future
+                if self.policy != "block":
+                    self.dropped += 1
+                    future.set_result(None)
+                    return future
+                while len(self._pending) >= self.max_queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    raise RuntimeError("OCR worker pool is shut down.")
+
+            batch = _Batch()
+            batch.add(plate_img, future)
+            self._pending.append(batch)
+            self._dispatch()
+        return future
+
+    def submit_many(self, plate_imgs: Iterable) -> List[Future]:
+        return [self.submit(plate_img) for plate_img in plate_imgs]
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "submitted": self.submitted,
+                "dropped": self.dropped,
+                "merged": self.merged,
+                "pending": len(self._pending),
+                "in_flight": self._in_flight,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._cond:
+            self._closed = True
+            if wait:
+                while self._pending or self._in_flight:
+                    self._cond.wait()
+            else:
+                while self._pending:
+                    for future in self._pending.popleft().futures:
+                        future.set_result(None)
+            self._cond.notify_all()
+        self._executor.shutdown(wait=wait)
+
+    def _dispatch(self) -> None:
+        # Caller holds self._cond; the condition's RLock tolerates callbacks that fire inline
+        while self._pending and self._in_flight < self.workers:
+            batch = self._pending.popleft()
+            self._in_flight += 1
+            job = self._executor.submit(_read_batch, batch.crops)
+            job.add_done_callback(partial(self._complete, batch))
+        self._cond.notify_all()
+
+    def _complete(self, batch: _Batch, job: Future) -> None:
+        try:
+            results = job.result()
+        except Exception as exc:  # pragma: no cover - logging only
+            print("[OCR POOL ERROR]", exc)
+            results = [None] * len(batch.crops)
+
+        for future, result in zip(batch.futures, results):
+            future.set_result(result)
+
+        with self._cond:
+            self._in_flight -= 1
+            self._dispatch()
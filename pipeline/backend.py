@@ -0,0 +1,68 @@
+"""Routes detection and OCR to the warm inference daemon, or loads the models in-process."""
+
+from threading import Lock
+from types import SimpleNamespace
+from typing import List
+
+from config import INFERENCE_SOCKET
+from inference.client import InferenceClient, connect
+
+_backend = None
+_backend_lock = Lock()
+
+
+def _resolve():
+    global _backend
+
+    with _backend_lock:
+        if _backend is None:
+            client = connect(INFERENCE_SOCKET)
+            if client:
+                print(f"[INFERENCE] Using daemon at {INFERENCE_SOCKET}")
+                _backend = client
+            else:
+                # Deferred so that thin clients never pay for loading YOLO or EasyOCR
+                from detection import detector
+                from ocr.plate_reader import read_plates as local_read
+
+                _backend = SimpleNamespace(
+                    detect_plate=detector.detect_plate,
+                    detect_plate_boxes=detector.detect_plate_boxes,
+                    detect_plates_batch=detector.detect_plates_batch,
+                    read_plates=local_read,
+                )
+    return _backend
+
+
+def _call(op: str, *args):
+    """Run ``op`` on the current backend; if the daemon went away, reconnect or fall back to local models once."""
+    global _backend
+
+    backend = _resolve()
+    try:
+        return getattr(backend, op)(*args)
+    except (ConnectionError, OSError) as exc:
+        if not isinstance(backend, InferenceClient):
+            raise
+        print("[INFERENCE] Lost daemon connection:", exc)
+        with _backend_lock:
+            if _backend is backend:
+                _backend = None
+        backend.close()
+    return getattr(_resolve(), op)(*args)
+
+
+def detect_plate(frame) -> List:
+    return _call("detect_plate", frame)
+
+
+def detect_plate_boxes(frame) -> List:
+    return _call("detect_plate_boxes", frame)
+
+
+def detect_plates_batch(frames) -> List[List]:
+    return _call("detect_plates_batch", list(frames))
+
+
+def read_plates(plate_imgs) -> List:
+    return _call("read_plates", list(plate_imgs))
@@ -0,0 +1,109 @@
+"""Background camera reader that always hands the processing loop the newest frame."""
+
+from collections import deque
+from threading import Condition, Thread
+import os
+import time
+from typing import Deque, Dict, Optional, Tuple
+
+import cv2
+
+from config import CAPTURE_BUFFER_SIZE
+
+
+def is_file_source(source) -> bool:
+    """Video files are worked through frame by frame; live sources only ever need the newest frame."""
+    return isinstance(source, str) and os.path.isfile(source)
+
+
+class LatestFrameCapture:
+    """Reads a cv2.VideoCapture on its own thread into a small ring buffer.
+
+    ``read`` returns the newest buffered frame and discards anything older, so
+    slow detection or OCR skips frames instead of working through a backlog.
+    With ``drop_stale=False`` (video files) frames are handed out oldest first
+    and the reader waits for room instead, so every frame is processed.
+    """
+
+    def __init__(self, source, buffer_size: int = CAPTURE_BUFFER_SIZE, drop_stale: bool = True):
+        self.source = source
+        self.drop_stale = drop_stale
+        self._cap = cv2.VideoCapture(source)
+        if not self._cap.isOpened():
+            raise RuntimeError(f"Unable to access camera source {source!r}. Check CAMERA_SOURCE in config.py")
+
+        self.captured = 0
+        self.dropped = 0
+        self.delivered = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._buffer: Deque[Tuple[float, object]] = deque(maxlen=max(1, buffer_size))
+        self._cond = Condition()
+        self._running = True
+        self._ended = False
+        self._thread = Thread(target=self._run, name=f"capture-{source}", daemon=True)
+        self._thread.start()
+
+    def read(self, timeout: Optional[float] = None):
+        """Return the newest frame (the oldest without ``drop_stale``), or None once the source has ended."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._buffer or self._ended, timeout=timeout)
+            if not self._buffer:
+                return None
+
+            if self.drop_stale:
+                captured_at, frame = self._buffer.pop()
+                self.dropped += len(self._buffer)
+                self._buffer.clear()
+            else:
+                captured_at, frame = self._buffer.popleft()
+                self._cond.notify_all()
+
+            latency = time.monotonic() - captured_at
+            self.delivered += 1
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+            return frame
+
+    @property
+    def ended(self) -> bool:
+        with self._cond:
+            return self._ended and not self._buffer
+
+    def stats(self) -> Dict[str, float]:
+        with self._cond:
+            average = self._latency_total / self.delivered if self.delivered else 0.0
+            return {
+                "captured": self.captured,
+                "dropped": self.dropped,
+                "delivered": self.delivered,
+                "avg_latency_ms": average * 1000.0,
+                "max_latency_ms": self._latency_max * 1000.0,
+            }
+
+    def release(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout=2.0)
+        self._cap.release()
+
+    def _run(self) -> None:
+        while self._running:
+            ok, frame = self._cap.read()
+            if not ok:
+                break
+            with self._cond:
+                if not self.drop_stale:
+                    self._cond.wait_for(lambda: len(self._buffer) < self._buffer.maxlen or not self._running)
+                    if not self._running:
+                        break
+                if len(self._buffer) == self._buffer.maxlen:
+                    self.dropped += 1
+                self._buffer.append((time.monotonic(), frame))
+                self.captured += 1
+                self._cond.notify()
+
+        with self._cond:
+            self._ended = True
+            self._cond.notify_all()
@@ -1,43 +1,170 @@
 """Shared frame processing logic for camera and video pipelines."""
-from typing import Any
+from typing import Any, Dict, List, Optional, Sequence
 
 from config import CLOUD_ENABLED, MIN_PLATE_HITS
 from classification.plate_color import classify_plate_color
 from cloud.cloud_sync import sync_to_cloud
-from db.database import mark_synced
-from detection.detector import detect_plate
-from ocr.plate_reader import read_plate
-from tracking.entry_exit import vehicle_entry, vehicle_exit, vehicle_log
-from tracking.plate_confirmer import clear_plate_vote, register_plate_vote
+from db.writer import mark_synced
+from ocr.plate_cache import PlateReadCache, is_cached
+from ocr.worker_pool import OcrWorkerPool
+from pipeline.backend import detect_plate, detect_plate_boxes, read_plates
+from tracking.box_tracker import PlateTracker
+from tracking.entry_exit import find_open_record, vehicle_entry, vehicle_exit, vehicle_log
+from tracking.plate_confirmer import PlateVoteStore, default_votes
 
 
 def process_frame(
     frame: Any,
     cloud_enabled: bool = CLOUD_ENABLED,
     min_plate_hits: int = MIN_PLATE_HITS,
+    ocr_pool: Optional[OcrWorkerPool] = None,
+    tracker: Optional[PlateTracker] = None,
+    read_cache: Optional[PlateReadCache] = None,
 ) -> None:
-    """Detect plates in a frame, persist entries, and sync exits when available."""
+    """Detect plates in a frame, persist entries, and sync exits when available.
+
+    ``read_cache`` belongs to this frame's source; tracked frames do not need it,
+    since the tracker already skips OCR on confirmed plates.
+    """
+    if tracker is not None:
+        process_tracked_frame(frame, tracker, cloud_enabled, ocr_pool)
+        return
+
     plates = detect_plate(frame)
-    required_hits = max(1, min_plate_hits)
+    readings = recognize_plates(plates, ocr_pool, [read_cache] * len(plates))
+    handle_readings(plates, readings, cloud_enabled, min_plate_hits, read_cache=read_cache)
 
-    for plate_img in plates:
-        plate_read = read_plate(plate_img)
+
+def handle_readings(
+    plates: List,
+    readings: List,
+    cloud_enabled: bool = CLOUD_ENABLED,
+    min_plate_hits: int = MIN_PLATE_HITS,
+    votes: PlateVoteStore = default_votes,
+    read_cache: Optional[PlateReadCache] = None,
+) -> None:
+    for plate_img, plate_read in zip(plates, readings):
         if not plate_read:
             continue
 
         number, confidence = plate_read
         vehicle_type = classify_plate_color(plate_img)
 
-        if number not in vehicle_log:
-            if required_hits > 1:
-                if not register_plate_vote(number, confidence, required_hits=required_hits):
-                    continue
-            vehicle_entry(number, vehicle_type)
-            clear_plate_vote(number)
+        record = record_sighting(number, confidence, vehicle_type, min_plate_hits, votes, is_cached(plate_read))
+        remember_reading(read_cache, plate_img, plate_read, record)
+        if record and cloud_enabled:
+            sync_exit(record["plate"], record, votes)
+
+
+def process_tracked_frame(
+    frame: Any,
+    tracker: PlateTracker,
+    cloud_enabled: bool = CLOUD_ENABLED,
+    ocr_pool: Optional[OcrWorkerPool] = None,
+) -> None:
+    """Track plate boxes across frames and only OCR tracks that are unconfirmed or due a re-check.
+
+    Each track reports its confirmed plate once, so entry/exit fires once per vehicle pass.
+    """
+    detections = detect_plate_boxes(frame)
+    tracks = tracker.update([box for box, _ in detections])
+    selected = tracker.select_for_ocr(tracks)
+    readings = recognize_plates([detections[idx][1] for idx in selected], ocr_pool)
+
+    for idx, plate_read in zip(selected, readings):
+        if not plate_read:
+            continue
+
+        track = tracks[idx]
+        confirmed = track.add_reading(plate_read[0], plate_read[1], tracker.required_hits)
+        if confirmed is None or confirmed == track.reported:
             continue
 
-        record = vehicle_exit(number)
-        if record and cloud_enabled and sync_to_cloud(record):
-            mark_synced(record["db_id"])
-            print(f"{number} synced to cloud.")
-            clear_plate_vote(number)
+        track.reported = confirmed
+        plate_img = detections[idx][1]
+        record = record_sighting(confirmed, track.best_conf, classify_plate_color(plate_img), 1)
+        if record and cloud_enabled:
+            sync_exit(confirmed, record)
+
+
+def recognize_plates(
+    plates: List,
+    ocr_pool: Optional[OcrWorkerPool] = None,
+    read_caches: Optional[Sequence[Optional[PlateReadCache]]] = None,
+) -> List:
+    """OCR every crop; ``read_caches`` names the cache of each crop's source to try first (None skips it)."""
+    readings: List = [None] * len(plates)
+    pending: List[int] = []
+    for idx, plate_img in enumerate(plates):
+        cache = read_caches[idx] if read_caches else None
+        readings[idx] = cache.lookup(plate_img) if cache is not None else None
+        if readings[idx] is None:
+            pending.append(idx)
+    if not pending:
+        return readings
+
+    crops = [plates[idx] for idx in pending]
+    if ocr_pool is not None:
+        fresh = [future.result() for future in ocr_pool.submit_many(crops)]
+    else:
+        fresh = read_plates(crops)
+    for idx, reading in zip(pending, fresh):
+        readings[idx] = reading
+    return readings
+
+
+def remember_reading(
+    read_cache: Optional[PlateReadCache],
+    plate_img: Any,
+    plate_read: tuple,
+    record: Optional[Dict[str, Any]],
+) -> None:
+    """Cache a fresh reading only once it names a confirmed plate, so unconfirmed plates keep getting fresh OCR."""
+    if read_cache is None or is_cached(plate_read):
+        return
+    number = plate_read[0]
+    if number in vehicle_log or (record is not None and record["plate"] == number):
+        read_cache.store(plate_img, plate_read)
+
+
+def record_sighting(
+    number: str,
+    confidence: float,
+    vehicle_type: str,
+    min_plate_hits: int = MIN_PLATE_HITS,
+    votes: PlateVoteStore = default_votes,
+    cached: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """Apply entry/exit logic for one plate reading and return the record when it closes a visit.
+
+    A ``cached`` reading only repeats an earlier one, so it never votes towards confirming a new plate.
+    """
+    required_hits = max(1, min_plate_hits)
+
+    # Sessions opened by another process on the same database count as inside too
+    if find_open_record(number) is None:
+        if required_hits > 1:
+            if cached:
+                return None
+            confirmed = votes.register(number, confidence, required_hits=required_hits)
+            if not confirmed:
+                return None
+            if find_open_record(confirmed) is not None:
+                votes.clear(confirmed)
+                return vehicle_exit(confirmed)
+            number = confirmed
+        vehicle_entry(number, vehicle_type)
+        votes.clear(number)
+        return None
+
+    return vehicle_exit(number)
+
+
+def sync_exit(number: str, record: Dict[str, Any], votes: PlateVoteStore = default_votes) -> bool:
+    if not sync_to_cloud(record):
+        return False
+
+    mark_synced(record["db_id"])
+    print(f"{number} synced to cloud.")
+    votes.clear(number)
+    return True
@@ -0,0 +1,94 @@
+"""Serve several camera or video sources from one process and one set of models."""
+
+import time
+from typing import Dict, List, Optional, Sequence
+
+import cv2
+
+from config import CLOUD_ENABLED, MIN_PLATE_HITS, MOTION_GATE_ENABLED
+from detection.motion import MotionGate
+from ocr.plate_cache import PlateReadCache
+from ocr.worker_pool import OcrWorkerPool
+from pipeline.backend import detect_plates_batch
+from pipeline.capture import LatestFrameCapture, is_file_source
+from pipeline.frame_processor import handle_readings, recognize_plates
+from tracking.plate_confirmer import PlateVoteStore
+
+IDLE_SLEEP_SECONDS = 0.005
+
+
+class CameraStream:
+    """Capture thread plus the per-source state that must not leak between gates."""
+
+    def __init__(self, source):
+        self.source = source
+        self.name = f"VEIL {source}"
+        self.capture = LatestFrameCapture(source, drop_stale=not is_file_source(source))
+        self.motion_gate = MotionGate() if MOTION_GATE_ENABLED else None
+        self.votes = PlateVoteStore()
+        self.read_cache = PlateReadCache()
+
+    def release(self) -> None:
+        self.capture.release()
+
+
+def run_multi_camera(
+    sources: Sequence,
+    cloud_enabled: bool = CLOUD_ENABLED,
+    min_plate_hits: int = MIN_PLATE_HITS,
+    ocr_pool: Optional[OcrWorkerPool] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Batch the newest frame of every source through one detector call per tick.
+
+    Crops from every stream are also recognised together, then handed back to
+    the vote store and read cache of the stream they came from. Returns capture and vote-store stats per source.
+    """
+    streams = [CameraStream(source) for source in sources]
+
+    try:
+        while streams:
+            active: List[CameraStream] = []
+            frames: List = []
+            read_any = False
+            for stream in streams:
+                frame = stream.capture.read(timeout=0)
+                if frame is None:
+                    continue
+                read_any = True
+                cv2.imshow(stream.name, frame)
+                if stream.motion_gate is None or stream.motion_gate.should_process(frame):
+                    active.append(stream)
+                    frames.append(frame)
+
+            if cv2.waitKey(1) == 27:  # ESC to quit
+                break
+            # Frames read this tick are processed first; only an empty tick can end the run
+            if not read_any and all(stream.capture.ended for stream in streams):
+                break
+            if not frames:
+                time.sleep(IDLE_SLEEP_SECONDS)
+                continue
+
+            plate_batches = detect_plates_batch(frames)
+            crops = [crop for plates in plate_batches for crop in plates]
+            caches = [stream.read_cache for stream, plates in zip(active, plate_batches) for _ in plates]
+            readings = recognize_plates(crops, ocr_pool, caches)
+
+            offset = 0
+            for stream, plates in zip(active, plate_batches):
+                stream_readings = readings[offset : offset + len(plates)]
+                offset += len(plates)
+                handle_readings(plates, stream_readings, cloud_enabled, min_plate_hits, stream.votes, stream.read_cache)
+    finally:
+        for stream in streams:
+            stream.release()
+        cv2.destroyAllWindows()
+
+    return {
+        str(stream.source): {
+            **stream.capture.stats(),
+            "vote_entries": len(stream.votes),
+            **{f"cache_{name}": value for name, value in stream.read_cache.stats().items()},
+        }
+        for stream in streams
+    }
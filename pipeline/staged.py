@@ -0,0 +1,183 @@
+"""Concurrent variant of process_frame with bounded queues between pipeline stages.
+
+Frames flow detect -> recognize -> classify -> persist -> sync. Each stage has
+its own worker threads and input queue, so a slow cloud round trip only
+backs up the sync queue instead of stalling detection.
+"""
+
+from queue import Full, Queue
+from threading import Lock, Thread
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from config import CLOUD_ENABLED, MIN_PLATE_HITS, PIPELINE_CONCURRENCY, PIPELINE_QUEUE_SIZE
+from classification.plate_color import classify_plate_color
+from ocr.plate_cache import PlateReadCache, is_cached
+from ocr.worker_pool import OcrWorkerPool
+from pipeline.backend import detect_plate
+from pipeline.frame_processor import recognize_plates, record_sighting, remember_reading, sync_exit
+
+STAGE_NAMES = ("detect", "recognize", "classify", "persist", "sync")
+_STOP = object()
+
+
+class _Stage:
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[object], Iterable],
+        workers: int,
+        queue_size: int,
+        downstream: Optional["_Stage"] = None,
+    ):
+        self.name = name
+        self.workers = max(1, workers)
+        self.processed = 0
+        self.failed = 0
+        self._handler = handler
+        self._downstream = downstream
+        self._queue: Queue = Queue(maxsize=max(1, queue_size))
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._stats_lock = Lock()
+        self._threads = [
+            Thread(target=self._run, name=f"{name}-{idx}", daemon=True) for idx in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def put(self, item, block: bool = True) -> bool:
+        try:
+            self._queue.put(item, block=block)
+        except Full:
+            return False
+        return True
+
+    def stop(self) -> None:
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def stats(self) -> Dict[str, float]:
+        with self._stats_lock:
+            average = self._latency_total / self.processed if self.processed else 0.0
+            return {
+                "workers": self.workers,
+                "queue_depth": self._queue.qsize(),
+                "processed": self.processed,
+                "failed": self.failed,
+                "avg_latency_ms": average * 1000.0,
+                "max_latency_ms": self._latency_max * 1000.0,
+            }
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            started = time.perf_counter()
+            try:
+                outputs = list(self._handler(item))
+            except Exception as exc:  # pragma: no cover - logging only
+                print(f"[PIPELINE:{self.name.upper()} ERROR]", exc)
+                with self._stats_lock:
+                    self.failed += 1
+                continue
+            elapsed = time.perf_counter() - started
+
+            with self._stats_lock:
+                self.processed += 1
+                self._latency_total += elapsed
+                self._latency_max = max(self._latency_max, elapsed)
+
+            if self._downstream is not None:
+                for output in outputs:
+                    self._downstream.put(output)
+
+
+class StagedPipeline:
+    """Runs the frame pipeline as five threaded stages joined by bounded queues.
+
+    ``concurrency`` maps stage names to worker counts. The persist stage always
+    runs on a single thread because entry/exit state is not thread-safe, and
+    detect/recognize should stay at one worker unless OCR runs in an
+    OcrWorkerPool, since the YOLO and EasyOCR models are shared.
+    """
+
+    def __init__(
+        self,
+        cloud_enabled: bool = CLOUD_ENABLED,
+        min_plate_hits: int = MIN_PLATE_HITS,
+        ocr_pool: Optional[OcrWorkerPool] = None,
+        concurrency: Optional[Dict[str, int]] = None,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+    ):
+        self.cloud_enabled = cloud_enabled
+        self.min_plate_hits = min_plate_hits
+        self.ocr_pool = ocr_pool
+        self.read_cache = PlateReadCache()
+        self.dropped_frames = 0
+
+        workers = dict(PIPELINE_CONCURRENCY)
+        workers.update(concurrency or {})
+        workers["persist"] = 1
+
+        # Built back to front so every stage knows where its output goes
+        handlers = {
+            "detect": self._detect,
+            "recognize": self._recognize,
+            "classify": self._classify,
+            "persist": self._persist,
+            "sync": self._sync,
+        }
+        downstream = None
+        self._stages: Dict[str, _Stage] = {}
+        for name in reversed(STAGE_NAMES):
+            downstream = _Stage(name, handlers[name], workers.get(name, 1), queue_size, downstream)
+            self._stages[name] = downstream
+
+    def submit(self, frame, block: bool = False) -> bool:
+        """Queue a frame for detection; returns False (and counts a drop) when the stage is full."""
+        accepted = self._stages["detect"].put(frame, block=block)
+        if not accepted:
+            self.dropped_frames += 1
+        return accepted
+
+    def close(self) -> None:
+        """Drain every queue in pipeline order and stop the worker threads."""
+        for name in STAGE_NAMES:
+            self._stages[name].stop()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        stats = {name: self._stages[name].stats() for name in STAGE_NAMES}
+        stats["detect"]["dropped_frames"] = self.dropped_frames
+        stats["recognize"].update({f"cache_{name}": value for name, value in self.read_cache.stats().items()})
+        return stats
+
+    def _detect(self, frame) -> List:
+        plates = detect_plate(frame)
+        return [plates] if plates else []
+
+    def _recognize(self, plates: List) -> List:
+        readings = recognize_plates(plates, self.ocr_pool, [self.read_cache] * len(plates))
+        return [(plate_img, reading) for plate_img, reading in zip(plates, readings) if reading]
+
+    def _classify(self, item) -> List:
+        plate_img, reading = item
+        return [(plate_img, reading, classify_plate_color(plate_img))]
+
+    def _persist(self, item) -> List:
+        plate_img, reading, vehicle_type = item
+        number, confidence = reading
+        record = record_sighting(number, confidence, vehicle_type, self.min_plate_hits, cached=is_cached(reading))
+        remember_reading(self.read_cache, plate_img, reading, record)
+        if record and self.cloud_enabled:
+            return [(record["plate"], record)]
+        return []
+
+    def _sync(self, item) -> List:
+        number, record = item
+        sync_exit(number, record)
+        return []
@@ -0,0 +1,109 @@
+"""Micro-benchmark of db.database per-operation latency.
+
+Compares the old connect-per-call pattern (default rollback journal, full
+fsync on every commit) with the persistent WAL connection now used by
+db.database. Runs against a throwaway database, for example:
+
+    python scripts/bench_sqlite.py --ops 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from statistics import mean, median
+from typing import Callable, Dict, List
+
+from db import database
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=1000, help="Vehicles to enter and exit per mode.")
+    parser.add_argument("--dir", type=Path, help="Directory for the scratch databases (default: a temp dir).")
+    return parser.parse_args()
+
+
+def _connect_per_call(db_path: str) -> Dict[str, Callable]:
+    """The pre-pooling data layer: a fresh connection and a full commit for every call."""
+
+    def add_entry(plate, vehicle_type, entry_time):
+        conn = sqlite3.connect(db_path)
+        cur = conn.execute(
+            "INSERT INTO vehicles (plate, type, entry_time) VALUES (?, ?, ?)",
+            (plate, vehicle_type, entry_time),
+        )
+        conn.commit()
+        row_id = cur.lastrowid
+        conn.close()
+        return row_id
+
+    def add_exit(row_id, exit_time):
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE vehicles SET exit_time = ? WHERE id = ? AND exit_time IS NULL", (exit_time, row_id))
+        conn.commit()
+        conn.close()
+
+    def mark_synced(row_id):
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE vehicles SET synced = 1 WHERE id = ?", (row_id,))
+        conn.commit()
+        conn.close()
+
+    return {"add_entry": add_entry, "add_exit": add_exit, "mark_synced": mark_synced}
+
+
+def _pooled() -> Dict[str, Callable]:
+    return {
+        "add_entry": database.add_entry,
+        "add_exit": database.add_exit,
+        "mark_synced": database.mark_synced,
+    }
+
+
+def run(ops: Dict[str, Callable], count: int) -> Dict[str, List[float]]:
+    timings: Dict[str, List[float]] = {name: [] for name in ops}
+
+    def timed(name, *args):
+        started = time.perf_counter()
+        result = ops[name](*args)
+        timings[name].append((time.perf_counter() - started) * 1e6)
+        return result
+
+    for idx in range(count):
+        entry_time = database.now_ms()
+        row_id = timed("add_entry", f"BENCH{idx:05d}", "private", entry_time)
+        timed("add_exit", row_id, entry_time + 300000)
+        timed("mark_synced", row_id)
+    return timings
+
+
+def report(label: str, timings: Dict[str, List[float]]) -> None:
+    print(f"\n===== {label} =====")
+    print(f"{'operation':<12} {'mean us':>10} {'median us':>10}")
+    for name, samples in timings.items():
+        print(f"{name:<12} {mean(samples):>10.1f} {median(samples):>10.1f}")
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory(dir=args.dir) as scratch:
+        legacy_path = str(Path(scratch) / "legacy.db")
+        database.DB_NAME = legacy_path
+        database.init_db()
+        database.close_conn()
+        # init_db switched the file to WAL; the old layer ran on the default rollback journal
+        sqlite3.connect(legacy_path).execute("PRAGMA journal_mode=DELETE").close()
+        report("connect per call", run(_connect_per_call(legacy_path), args.ops))
+
+        database.DB_NAME = str(Path(scratch) / "pooled.db")
+        database.init_db()
+        report("persistent WAL connection", run(_pooled(), args.ops))
+        database.close_conn()
+
+
+if __name__ == "__main__":
+    main()
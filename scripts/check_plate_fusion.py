@@ -0,0 +1,54 @@
+"""Sanity checks for the plate vote fusion in tracking.plate_confirmer.
+
+Replays short reading sequences through a fresh PlateVoteStore and exits
+non-zero if any of them confirms the wrong plate or confirms too early:
+
+    python -m scripts.check_plate_fusion
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from tracking.plate_confirmer import PlateVoteStore
+
+Reading = Tuple[str, float]
+
+
+def replay(readings: Sequence[Reading], required_hits: int) -> List[Optional[str]]:
+    store = PlateVoteStore()
+    return [store.register(plate, confidence, required_hits) for plate, confidence in readings]
+
+
+def check(name: str, readings: Sequence[Reading], required_hits: int, expected: List[Optional[str]]) -> bool:
+    results = replay(readings, required_hits)
+    ok = results == expected
+    print(f"[{'OK' if ok else 'FAIL'}] {name}: {results}")
+    return ok
+
+
+def main() -> None:
+    checks = [
+        check(
+            "partial first read does not fix the length",
+            [("KA01AB123", 0.9)] + [("KA01AB1234", 0.9)] * 3,
+            2,
+            [None, None, "KA01AB1234", "KA01AB1234"],
+        ),
+        check(
+            "one-character misread is fused",
+            [("KA01AB1234", 0.9), ("KA01A81234", 0.9), ("KA01AB1234", 0.9)],
+            2,
+            [None, None, "KA01AB1234"],
+        ),
+        check(
+            "MIN_PLATE_HITS stays a minimum reading count",
+            [("KA01AB1234", 0.9)] * 6,
+            5,
+            [None, None, None, None, "KA01AB1234", "KA01AB1234"],
+        ),
+    ]
+    if not all(checks):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
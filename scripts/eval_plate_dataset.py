@@ -18,15 +18,16 @@ import argparse
 import csv
 import json
 import re
+import time
 from difflib import SequenceMatcher
 from pathlib import Path
 from statistics import mean
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import cv2
 
-from detection.detector import detect_plate
-from ocr.plate_reader import read_plate
+from config import PLATE_BATCH_SIZE
+from pipeline.backend import detect_plates_batch, read_plates
 
 
 def parse_args() -> argparse.Namespace:
@@ -64,6 +65,18 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Use the image filename stem as the label when --labels is omitted or missing entries.",
     )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=["torch", "onnx", "onnx-int8"],
+        help="Evaluate each local detector backend in turn and report accuracy and latency side by side.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=PLATE_BATCH_SIZE,
+        help=f"Images per batched detector call (default: {PLATE_BATCH_SIZE}).",
+    )
     return parser.parse_args()
 
 
@@ -134,17 +147,49 @@ def collect_images(folder: Path, patterns: Iterable[str]) -> List[Path]:
     return sorted(set(files))
 
 
-def evaluate_image(image_path: Path, ground_truth: Optional[str]) -> dict:
-    frame = cv2.imread(str(image_path))
-    if frame is None:
-        raise RuntimeError(f"Failed to load image: {image_path}")
-
-    plate_crops = detect_plate(frame)
+def evaluate_image(
+    image_path: Path,
+    ground_truth: Optional[str],
+    detect_batch: Callable = detect_plates_batch,
+) -> dict:
+    return evaluate_batch([(image_path, ground_truth)], detect_batch)[0]
+
+
+def evaluate_batch(
+    entries: List[Tuple[Path, Optional[str]]],
+    detect_batch: Callable = detect_plates_batch,
+) -> List[dict]:
+    """Detect plates on a batch of images in one call, then score each image's best reading."""
+    frames = []
+    for image_path, _ in entries:
+        frame = cv2.imread(str(image_path))
+        if frame is None:
+            raise RuntimeError(f"Failed to load image: {image_path}")
+        frames.append(frame)
+
+    started = time.perf_counter()
+    plate_batches = detect_batch(frames)
+    # Latency is reported per image, so the batched call is shared evenly across the batch
+    detect_ms = (time.perf_counter() - started) * 1000.0 / len(frames)
+
+    rows = []
+    for (image_path, ground_truth), plate_crops in zip(entries, plate_batches):
+        detected_at = time.perf_counter()
+        readings = read_plates(plate_crops)
+        finished = time.perf_counter()
+
+        row = _score(image_path, ground_truth, plate_crops, readings)
+        row["detect_ms"] = detect_ms
+        row["ocr_ms"] = (finished - detected_at) * 1000.0
+        rows.append(row)
+    return rows
+
+
+def _score(image_path: Path, ground_truth: Optional[str], plate_crops: List, readings: List) -> dict:
     best_prediction: Optional[str] = None
     best_conf = 0.0
 
-    for crop in plate_crops:
-        result = read_plate(crop)
+    for result in readings:
         if not result:
             continue
         text, conf = result
@@ -170,7 +215,18 @@ def evaluate_image(image_path: Path, ground_truth: Optional[str]) -> dict:
 
 def save_report(rows: List[dict], output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = ["image", "ground_truth", "prediction", "confidence", "detected", "exact_match", "similarity"]
+    fieldnames = [
+        "backend",
+        "image",
+        "ground_truth",
+        "prediction",
+        "confidence",
+        "detected",
+        "exact_match",
+        "similarity",
+        "detect_ms",
+        "ocr_ms",
+    ]
     with output_path.open("w", newline="", encoding="utf-8") as handle:
         writer = csv.DictWriter(handle, fieldnames=fieldnames)
         writer.writeheader()
@@ -182,6 +238,61 @@ def infer_label_from_stem(path: Path) -> Optional[str]:
     return _clean_text(path.stem)
 
 
+def evaluate_files(
+    files: List[Path],
+    label_map: Dict[str, str],
+    fallback_stem: bool,
+    detect_batch: Callable,
+    batch_size: int = PLATE_BATCH_SIZE,
+) -> List[dict]:
+    rows: List[dict] = []
+    batch_size = max(1, batch_size)
+    for start in range(0, len(files), batch_size):
+        entries = []
+        for image_path in files[start : start + batch_size]:
+            lookup_key = _normalize_key(image_path.name)
+            ground_truth = label_map.get(lookup_key)
+            if ground_truth is None and fallback_stem:
+                ground_truth = infer_label_from_stem(image_path)
+            entries.append((image_path, ground_truth))
+
+        before = len(rows)
+        rows.extend(evaluate_batch(entries, detect_batch))
+
+        if len(rows) // 25 > before // 25 or len(rows) == len(files):
+            print(f"Processed {len(rows)}/{len(files)} images...")
+    return rows
+
+
+def summarize(rows: List[dict]) -> dict:
+    similarities = [row["similarity"] for row in rows]
+    return {
+        "images": len(rows),
+        "detection_rate": sum(1 for row in rows if row["detected"]) / len(rows),
+        "exact_rate": sum(1 for row in rows if row["exact_match"]) / len(rows),
+        "avg_similarity": mean(similarities) if similarities else 0.0,
+        "detect_ms": mean(row["detect_ms"] for row in rows),
+        "ocr_ms": mean(row["ocr_ms"] for row in rows),
+    }
+
+
+def _local_detector(backend: str) -> Callable:
+    from detection import detector
+
+    detector.use_backend(backend)
+    return detector.detect_plates_batch
+
+
+def print_comparison(summaries: Dict[str, dict]) -> None:
+    print("\n===== Backend Comparison =====")
+    print(f"{'backend':<10} {'detect':>8} {'exact':>8} {'similar':>8} {'det ms':>9} {'ocr ms':>9}")
+    for backend, summary in summaries.items():
+        print(
+            f"{backend:<10} {summary['detection_rate']:>8.2%} {summary['exact_rate']:>8.2%} "
+            f"{summary['avg_similarity']:>8.3f} {summary['detect_ms']:>9.1f} {summary['ocr_ms']:>9.1f}"
+        )
+
+
 def main() -> None:
     args = parse_args()
     label_map = load_labels(args.labels, args.image_field, args.label_field)
@@ -192,32 +303,30 @@ def main() -> None:
     if not files:
         raise RuntimeError("No images found for the provided patterns.")
 
-    rows: List[dict] = []
-    for idx, image_path in enumerate(files, start=1):
-        lookup_key = _normalize_key(image_path.name)
-        ground_truth = label_map.get(lookup_key)
-        if ground_truth is None and args.fallback_stem:
-            ground_truth = infer_label_from_stem(image_path)
-
-        result = evaluate_image(image_path, ground_truth)
-        rows.append(result)
-
-        if idx % 25 == 0 or idx == len(files):
-            print(f"Processed {idx}/{len(files)} images...")
-
-    detection_rate = sum(1 for row in rows if row["detected"]) / len(rows)
-    exact_rate = sum(1 for row in rows if row["exact_match"]) / len(rows)
-    similarities = [row["similarity"] for row in rows]
-    avg_similarity = mean(similarities) if similarities else 0.0
-
-    print("\n===== Evaluation Summary =====")
-    print(f"Images evaluated    : {len(rows)}")
-    print(f"Detection hit rate  : {detection_rate:.2%}")
-    print(f"Exact OCR match rate: {exact_rate:.2%}")
-    print(f"Avg. similarity     : {avg_similarity:.3f}")
+    all_rows: List[dict] = []
+    summaries: Dict[str, dict] = {}
+    for backend in args.backends or ["default"]:
+        detect_batch = _local_detector(backend) if args.backends else detect_plates_batch
+        rows = evaluate_files(files, label_map, args.fallback_stem, detect_batch, args.batch_size)
+        for row in rows:
+            row["backend"] = backend
+        all_rows.extend(rows)
+
+        summary = summarize(rows)
+        summaries[backend] = summary
+        print(f"\n===== Evaluation Summary ({backend}) =====")
+        print(f"Images evaluated    : {summary['images']}")
+        print(f"Detection hit rate  : {summary['detection_rate']:.2%}")
+        print(f"Exact OCR match rate: {summary['exact_rate']:.2%}")
+        print(f"Avg. similarity     : {summary['avg_similarity']:.3f}")
+        print(f"Avg. detect latency : {summary['detect_ms']:.1f} ms")
+        print(f"Avg. OCR latency    : {summary['ocr_ms']:.1f} ms")
+
+    if len(summaries) > 1:
+        print_comparison(summaries)
 
     if args.output:
-        save_report(rows, args.output)
+        save_report(all_rows, args.output)
         print(f"Detailed report written to {args.output}")
 
 
@@ -0,0 +1,162 @@
+"""Box-level plate tracker so OCR runs per vehicle instead of per frame."""
+
+from itertools import count
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from config import MIN_PLATE_HITS, TRACK_IOU_THRESHOLD, TRACK_MAX_MISSES, TRACK_RECHECK_FRAMES
+from tracking.plate_confirmer import PlateVoteStore
+
+Box = Tuple[float, float, float, float]
+
+
+def iou(a: Box, b: Box) -> float:
+    x1, y1 = max(a[0], b[0]), max(a[1], b[1])
+    x2, y2 = min(a[2], b[2]), min(a[3], b[3])
+    inter = max(0.0, x2 - x1) * max(0.0, y2 - y1)
+    if inter <= 0:
+        return 0.0
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def _box_to_state(box: Box) -> np.ndarray:
+    x1, y1, x2, y2 = box
+    return np.array([[(x1 + x2) / 2.0], [(y1 + y2) / 2.0], [x2 - x1], [y2 - y1]], dtype=np.float32)
+
+
+def _state_to_box(state: np.ndarray) -> Box:
+    cx, cy, w, h = (float(v) for v in state[:4, 0])
+    w, h = max(1.0, w), max(1.0, h)
+    return cx - w / 2.0, cy - h / 2.0, cx + w / 2.0, cy + h / 2.0
+
+
+class PlateTrack:
+    """One plate followed across frames by a constant-velocity Kalman filter over (cx, cy, w, h)."""
+
+    def __init__(self, track_id: int, box: Box):
+        self.track_id = track_id
+        self.box = tuple(box)
+        self.hits = 1
+        self.misses = 0
+        self.frames_since_ocr: Optional[int] = None
+        self.votes = PlateVoteStore()
+        self.best_conf = 0.0
+        self.confirmed: Optional[str] = None
+        self.reported: Optional[str] = None
+
+        # State: cx, cy, w, h, vx, vy; measurement: cx, cy, w, h
+        self._kf = cv2.KalmanFilter(6, 4)
+        self._kf.transitionMatrix = np.eye(6, dtype=np.float32)
+        self._kf.transitionMatrix[0, 4] = 1.0
+        self._kf.transitionMatrix[1, 5] = 1.0
+        self._kf.measurementMatrix = np.eye(4, 6, dtype=np.float32)
+        self._kf.processNoiseCov = np.eye(6, dtype=np.float32) * 1e-2
+        self._kf.measurementNoiseCov = np.eye(4, dtype=np.float32) * 1e-1
+        self._kf.errorCovPost = np.eye(6, dtype=np.float32) * 10.0
+        self._kf.statePost = np.vstack([_box_to_state(box), np.zeros((2, 1), dtype=np.float32)])
+
+    def predict(self) -> Box:
+        self.box = _state_to_box(self._kf.predict())
+        return self.box
+
+    def correct(self, box: Box) -> None:
+        self._kf.correct(_box_to_state(box))
+        self.box = tuple(box)
+        self.hits += 1
+        self.misses = 0
+
+    def needs_ocr(self, recheck_frames: int) -> bool:
+        """Unconfirmed tracks are read every frame, confirmed ones every ``recheck_frames``."""
+        if self.frames_since_ocr is None or self.confirmed is None:
+            return True
+        return recheck_frames > 0 and self.frames_since_ocr >= recheck_frames
+
+    def add_reading(self, text: str, confidence: float, required_hits: int) -> Optional[str]:
+        """Fuse an OCR reading into this track and return its plate text once confirmed."""
+        self.best_conf = max(self.best_conf, confidence)
+        confirmed = self.votes.register(text, confidence, required_hits)
+        if confirmed:
+            self.confirmed = confirmed
+        return self.confirmed
+
+
+class PlateTracker:
+    """Assigns stable track IDs to detector boxes by greedy IoU matching against Kalman predictions."""
+
+    def __init__(
+        self,
+        iou_threshold: float = TRACK_IOU_THRESHOLD,
+        max_misses: int = TRACK_MAX_MISSES,
+        recheck_frames: int = TRACK_RECHECK_FRAMES,
+        required_hits: int = MIN_PLATE_HITS,
+    ):
+        self.iou_threshold = iou_threshold
+        self.max_misses = max_misses
+        self.recheck_frames = recheck_frames
+        self.required_hits = max(1, required_hits)
+        self.tracks: List[PlateTrack] = []
+        self.ocr_calls = 0
+        self.ocr_skipped = 0
+        self.tracks_started = 0
+        self._ids = count(1)
+
+    def update(self, boxes: Sequence[Box]) -> List[PlateTrack]:
+        """Advance every track by one frame and return the track matched to each box, in order."""
+        for track in self.tracks:
+            track.predict()
+            if track.frames_since_ocr is not None:
+                track.frames_since_ocr += 1
+
+        pairs = sorted(
+            (
+                (iou(track.box, box), t_idx, b_idx)
+                for t_idx, track in enumerate(self.tracks)
+                for b_idx, box in enumerate(boxes)
+            ),
+            reverse=True,
+        )
+
+        assigned: List = [None] * len(boxes)
+        used_tracks = set()
+        for overlap, t_idx, b_idx in pairs:
+            if overlap < self.iou_threshold:
+                break
+            if t_idx in used_tracks or assigned[b_idx] is not None:
+                continue
+            used_tracks.add(t_idx)
+            self.tracks[t_idx].correct(boxes[b_idx])
+            assigned[b_idx] = self.tracks[t_idx]
+
+        for t_idx, track in enumerate(self.tracks):
+            if t_idx not in used_tracks:
+                track.misses += 1
+
+        for b_idx, box in enumerate(boxes):
+            if assigned[b_idx] is None:
+                track = PlateTrack(next(self._ids), box)
+                self.tracks.append(track)
+                self.tracks_started += 1
+                assigned[b_idx] = track
+
+        self.tracks = [track for track in self.tracks if track.misses <= self.max_misses]
+        return assigned
+
+    def select_for_ocr(self, tracks: Sequence[PlateTrack]) -> List[int]:
+        """Indexes of the tracks whose crops should be read this frame."""
+        selected = [idx for idx, track in enumerate(tracks) if track.needs_ocr(self.recheck_frames)]
+        for idx in selected:
+            tracks[idx].frames_since_ocr = 0
+        self.ocr_calls += len(selected)
+        self.ocr_skipped += len(tracks) - len(selected)
+        return selected
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "active_tracks": len(self.tracks),
+            "tracks_started": self.tracks_started,
+            "ocr_calls": self.ocr_calls,
+            "ocr_skipped": self.ocr_skipped,
+        }
@@ -1,23 +1,52 @@
-from collections import deque
-from datetime import datetime, timedelta
+from datetime import datetime
 from difflib import SequenceMatcher
-from typing import Any, Deque, Dict, Optional, Tuple
+import math
+from typing import Any, Dict, Optional, Set
 
-from db.database import add_entry, add_exit
+from db.database import find_open_session, get_open_sessions, now_ms
+from db.writer import add_entry, add_exit
 from config import ENTRY_DEDUP_SIMILARITY, ENTRY_DEDUP_WINDOW_SECONDS
+from tracking.plate_index import RecentPlateIndex
 
 vehicle_log: Dict[str, Dict[str, Any]] = {}
-recent_entries: Deque[Tuple[str, datetime]] = deque()
-
-
-def _prune_recent(now: datetime) -> None:
-    if ENTRY_DEDUP_WINDOW_SECONDS <= 0:
-        recent_entries.clear()
-        return
-
-    cutoff = now - timedelta(seconds=ENTRY_DEDUP_WINDOW_SECONDS)
-    while recent_entries and recent_entries[0][1] < cutoff:
-        recent_entries.popleft()
+recent_entries = RecentPlateIndex(ENTRY_DEDUP_WINDOW_SECONDS)
+# db_ids whose exit is still queued in the write-behind writer; the row reads as open until it commits
+pending_exits: Set[int] = set()
+
+
+def _session_record(row) -> Dict[str, Any]:
+    db_id, plate, vehicle_type, entry_time = row
+    return {
+        "plate": plate,
+        "type": vehicle_type,
+        "entry_time": entry_time,
+        "exit_time": None,
+        "db_id": db_id,
+    }
+
+
+def restore_open_sessions() -> int:
+    """Reload vehicles that were still inside when the process last stopped."""
+    vehicle_log.clear()
+    for row in get_open_sessions():
+        record = _session_record(row)
+        current = vehicle_log.get(record["plate"])
+        if current is None or record["entry_time"] > current["entry_time"]:
+            vehicle_log[record["plate"]] = record
+    if vehicle_log:
+        print(f"[RESTORE] {len(vehicle_log)} vehicle(s) still inside")
+    return len(vehicle_log)
+
+
+def find_open_record(plate: str) -> Optional[Dict[str, Any]]:
+    """Open session for ``plate`` from memory, or from the database when another process opened it."""
+    record = vehicle_log.get(plate)
+    if record is None:
+        # The partial index on open sessions keeps this lookup cheap
+        row = find_open_session(plate)
+        if row is not None and row[0] not in pending_exits:
+            record = vehicle_log[plate] = _session_record(row)
+    return record
 
 
 def _plate_similarity(a: str, b: str) -> float:
@@ -28,24 +57,36 @@ def _plate_similarity(a: str, b: str) -> float:
     return SequenceMatcher(None, a, b).ratio()
 
 
+def _max_edit_distance(plate: str, similarity: float) -> int:
+    """Largest Levenshtein distance at which SequenceMatcher could still reach ``similarity``.
+
+    A ratio of 2M/T with M matched characters allows at most T - 2M edits, and
+    T <= 2 * len(plate) + d, so d <= 2 * len(plate) * (1 - s) / s.
+    """
+    if similarity <= 0:
+        return len(plate) * 2
+    return math.floor(2 * len(plate) * (1.0 - similarity) / similarity)
+
+
 def _is_duplicate_plate(plate: str, now: datetime) -> bool:
     if ENTRY_DEDUP_WINDOW_SECONDS <= 0:
         return False
 
-    _prune_recent(now)
-    for recent_plate, _ in recent_entries:
+    # The index narrows candidates by edit distance; the ratio check keeps the old threshold semantics
+    for recent_plate, _ in recent_entries.search(plate, _max_edit_distance(plate, ENTRY_DEDUP_SIMILARITY), now):
         if _plate_similarity(plate, recent_plate) >= ENTRY_DEDUP_SIMILARITY:
             return True
     return False
 
 
 def _remember_plate(plate: str, timestamp: datetime) -> None:
-    recent_entries.append((plate, timestamp))
+    if ENTRY_DEDUP_WINDOW_SECONDS > 0:
+        recent_entries.add(plate, timestamp)
 
 
 def vehicle_entry(plate: str, vehicle_type: str) -> Dict[str, Any]:
     now = datetime.now()
-    entry_time = now.strftime("%Y-%m-%d %H:%M:%S")
+    entry_time = now_ms()
 
     if _is_duplicate_plate(plate, now):
         print(
@@ -80,14 +121,18 @@ def vehicle_entry(plate: str, vehicle_type: str) -> Dict[str, Any]:
 
 
 def vehicle_exit(plate: str) -> Optional[Dict[str, Any]]:
-    record = vehicle_log.get(plate)
+    record = find_open_record(plate)
     if not record:
         return None
 
-    exit_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    exit_time = now_ms()
     record["exit_time"] = exit_time
 
-    add_exit(record["db_id"], exit_time)
+    db_id = record["db_id"]
+    future = add_exit(db_id, exit_time)
+    if future is not None:
+        pending_exits.add(db_id)
+        future.add_done_callback(lambda _: pending_exits.discard(db_id))
 
     vehicle_log.pop(plate, None)
     print(f"[EXIT] {plate}")
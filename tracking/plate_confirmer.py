@@ -1,10 +1,26 @@
-"""Accumulates multiple OCR hits before trusting a plate value."""
-from typing import Dict, Optional
+"""Fuses OCR hits from consecutive frames before trusting a plate value.
 
-from config import MIN_PLATE_HITS
+Readings that differ in a character or two (``KA01AB1234`` vs ``KA01A81234``)
+are aligned into one cluster and voted per character position, weighted by OCR
+confidence, instead of splitting their votes across exact strings.
+"""
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from itertools import count
+import math
+from threading import Lock
+import time
+from typing import Dict, List, Optional
 
-# in-memory map of plate -> vote data
-_plate_votes: Dict[str, Dict[str, float]] = {}
+import numpy as np
+
+from config import FUSION_MAX_MISMATCH, FUSION_THRESHOLD, MIN_PLATE_HITS, VOTE_MAX_ENTRIES, VOTE_TTL_SECONDS
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+ALPHABET_SIZE = len(ALPHABET)
+CHAR_INDEX = {char: idx for idx, char in enumerate(ALPHABET)}
+MIN_CHAR_CONF = 0.05
+MAX_CHAR_CONF = 0.99
 
 
 def _target_hits(required_hits: Optional[int]) -> int:
@@ -13,13 +29,187 @@ def _target_hits(required_hits: Optional[int]) -> int:
     return max(1, required_hits)
 
 
-def register_plate_vote(plate: str, confidence: float, required_hits: Optional[int] = None) -> bool:
-    """Record an OCR hit and return True once the threshold is met."""
-    entry = _plate_votes.setdefault(plate, {"count": 0, "best_conf": 0.0})
-    entry["count"] += 1
-    entry["best_conf"] = max(entry["best_conf"], confidence)
-    return entry["count"] >= _target_hits(required_hits)
+def _evidence(confidence: float) -> float:
+    """Log-likelihood ratio that a position shows the read character rather than a specific other one."""
+    conf = min(MAX_CHAR_CONF, max(MIN_CHAR_CONF, confidence))
+    return math.log(conf) - math.log((1.0 - conf) / (ALPHABET_SIZE - 1))
+
+
+def _align(reading: str, consensus: str) -> List[Optional[str]]:
+    """Map each consensus position to the reading's character there, or None where they do not line up."""
+    if len(reading) == len(consensus):
+        return list(reading)
+
+    aligned: List[Optional[str]] = [None] * len(consensus)
+    matcher = SequenceMatcher(None, consensus, reading, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal" or (tag == "replace" and i2 - i1 == j2 - j1):
+            for offset in range(i2 - i1):
+                aligned[i1 + offset] = reading[j1 + offset]
+    return aligned
+
+
+class _PlateCluster:
+    """Per-position character scores for one plate, as a (positions x alphabet) array per reading length.
+
+    The consensus is taken from the length with the most evidence, so a partial
+    read as the plate enters the frame cannot fix the plate's length.
+    """
+
+    __slots__ = ("scores", "weights", "counts", "best_conf", "consensus", "updated")
+
+    def __init__(self, reading: str, now: float):
+        self.scores: Dict[int, np.ndarray] = {}
+        self.weights: Dict[int, float] = {}
+        self.counts: Dict[int, int] = {}
+        self.best_conf = 0.0
+        self.consensus = reading
+        self.updated = now
+
+    @property
+    def readings(self) -> int:
+        """Readings of the consensus length, i.e. the ones its scores were built from."""
+        return self.counts.get(len(self.consensus), 0)
+
+    def mismatches(self, reading: str) -> int:
+        if abs(len(reading) - len(self.consensus)) > 1:
+            return len(self.consensus)
+        aligned = _align(reading, self.consensus)
+        return sum(1 for char, expected in zip(aligned, self.consensus) if char != expected)
+
+    def add(self, reading: str, confidence: float, now: float) -> None:
+        length = len(reading)
+        weight = _evidence(confidence)
+        scores = self.scores.get(length)
+        if scores is None:
+            scores = self.scores[length] = np.zeros((length, ALPHABET_SIZE), dtype=np.float32)
+        for position, char in enumerate(reading):
+            if char in CHAR_INDEX:
+                scores[position, CHAR_INDEX[char]] += weight
+        self.weights[length] = self.weights.get(length, 0.0) + weight
+        self.counts[length] = self.counts.get(length, 0) + 1
+        self.best_conf = max(self.best_conf, confidence)
+        self.updated = now
+
+        best_length = max(self.weights, key=self.weights.get)
+        scores = self.scores[best_length]
+        fallback = self.consensus if len(self.consensus) == best_length else reading
+        if len(fallback) != best_length:
+            fallback = "?" * best_length
+        winners = scores.argmax(axis=1)
+        seen = scores.max(axis=1) > 0
+        self.consensus = "".join(
+            ALPHABET[winner] if has_votes else char for winner, has_votes, char in zip(winners, seen, fallback)
+        )
+
+    def posterior(self) -> float:
+        """Probability that every position of the consensus is right, under a uniform character prior."""
+        scores = self.scores[len(self.consensus)]
+        top = scores.max(axis=1, keepdims=True)
+        if not (top > 0).all():
+            return 0.0
+        # Characters never read keep a score of 0, i.e. the prior; subtracting the winner keeps exp finite
+        totals = np.exp(scores.astype(np.float64) - top).sum(axis=1)
+        return float(np.exp(-np.log(totals).sum()))
+
+
+class PlateVoteStore:
+    """In-memory clusters of recent readings; one per camera source.
+
+    Clusters expire ``ttl_seconds`` after their last reading, and once
+    ``max_entries`` are held the least recently updated one is evicted, so
+    one-off misreads cannot accumulate on a long-running gate. A lock guards
+    the clusters, since exits clear votes from the sync workers.
+    """
+
+    def __init__(
+        self,
+        threshold: float = FUSION_THRESHOLD,
+        max_mismatch: int = FUSION_MAX_MISMATCH,
+        ttl_seconds: float = VOTE_TTL_SECONDS,
+        max_entries: int = VOTE_MAX_ENTRIES,
+    ):
+        self.threshold = threshold
+        self.max_mismatch = max_mismatch
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.expired = 0
+        self.evicted = 0
+        self._clusters: "OrderedDict[int, _PlateCluster]" = OrderedDict()
+        self._ids = count()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clusters)
+
+    def register(self, plate: str, confidence: float, required_hits: Optional[int] = None) -> Optional[str]:
+        """Fuse an OCR hit and return the confirmed plate text once the fused posterior is high enough.
+
+        The consensus also needs at least ``required_hits`` readings (default
+        MIN_PLATE_HITS); with 1 every reading is trusted as-is.
+        """
+        target = _target_hits(required_hits)
+        if target <= 1:
+            return plate
+
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            key = self._match(plate)
+            if key is None:
+                key = next(self._ids)
+                self._clusters[key] = _PlateCluster(plate, now)
+                while len(self._clusters) > self.max_entries:
+                    self._clusters.popitem(last=False)
+                    self.evicted += 1
+            cluster = self._clusters[key]
+            cluster.add(plate, confidence, now)
+            self._clusters.move_to_end(key)
+
+            if cluster.readings >= target and cluster.posterior() >= self.threshold:
+                return cluster.consensus
+            return None
+
+    def clear(self, plate: str) -> None:
+        with self._lock:
+            stale = [
+                key
+                for key, cluster in self._clusters.items()
+                if cluster.consensus == plate or cluster.mismatches(plate) <= self.max_mismatch
+            ]
+            for key in stale:
+                del self._clusters[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._clusters), "expired": self.expired, "evicted": self.evicted}
+
+    def _expire(self, now: float) -> None:
+        # Clusters are kept in update order, so expired ones are always at the front
+        while self._clusters:
+            key, cluster = next(iter(self._clusters.items()))
+            if now - cluster.updated <= self.ttl_seconds:
+                return
+            del self._clusters[key]
+            self.expired += 1
+
+    def _match(self, plate: str) -> Optional[int]:
+        best, best_mismatches = None, self.max_mismatch + 1
+        for key, cluster in self._clusters.items():
+            mismatches = cluster.mismatches(plate)
+            if mismatches < best_mismatches:
+                best, best_mismatches = key, mismatches
+        return best
+
+
+default_votes = PlateVoteStore()
+
+
+def register_plate_vote(plate: str, confidence: float, required_hits: Optional[int] = None) -> Optional[str]:
+    """Record an OCR hit and return the fused plate text once it is confirmed."""
+    return default_votes.register(plate, confidence, required_hits)
 
 
 def clear_plate_vote(plate: str) -> None:
-    _plate_votes.pop(plate, None)
+    default_votes.clear(plate)
@@ -0,0 +1,120 @@
+"""BK-tree over Levenshtein distance for "similar plate seen recently" queries."""
+
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+def levenshtein(a: str, b: str) -> int:
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+class _Node:
+    __slots__ = ("plate", "seen", "children")
+
+    def __init__(self, plate: str, seen: datetime):
+        self.plate = plate
+        self.seen = seen
+        self.children: Dict[int, "_Node"] = {}
+
+
+class RecentPlateIndex:
+    """Plates seen within the last ``window_seconds``, searchable by edit distance.
+
+    Expired plates are dropped lazily: they stay in the tree as dead nodes that
+    queries step over, and the tree is rebuilt from the live plates once the dead
+    outnumber them, so eviction stays amortised O(1) per plate.
+    """
+
+    def __init__(self, window_seconds: float):
+        self.window = timedelta(seconds=window_seconds)
+        self._root: Optional[_Node] = None
+        self._nodes: Dict[str, _Node] = {}
+        self._expiry: Deque[Tuple[str, datetime]] = deque()
+        self._live = 0
+
+    def __len__(self) -> int:
+        return self._live
+
+    def add(self, plate: str, seen: datetime) -> None:
+        self.prune(seen)
+        node = self._nodes.get(plate)
+        if node is None:
+            node = _Node(plate, seen)
+            self._nodes[plate] = node
+            self._insert(node)
+            self._live += 1
+        else:
+            if not self._is_live(node, seen):
+                self._live += 1
+            node.seen = seen
+        self._expiry.append((plate, seen))
+
+    def search(self, plate: str, max_distance: int, now: datetime) -> List[Tuple[str, int]]:
+        """Live plates within ``max_distance`` edits of ``plate``, nearest first."""
+        self.prune(now)
+        matches: List[Tuple[str, int]] = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            distance = levenshtein(plate, node.plate)
+            if distance <= max_distance and self._is_live(node, now):
+                matches.append((node.plate, distance))
+            # Triangle inequality: only subtrees at distance d +/- max_distance can hold matches
+            for edge, child in node.children.items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+        return sorted(matches, key=lambda item: item[1])
+
+    def prune(self, now: datetime) -> None:
+        cutoff = now - self.window
+        while self._expiry and self._expiry[0][1] < cutoff:
+            plate, seen = self._expiry.popleft()
+            node = self._nodes.get(plate)
+            # Only the newest sighting of a plate retires it
+            if node is not None and node.seen == seen:
+                self._live -= 1
+
+        if len(self._nodes) > 2 * self._live + 16:
+            self._rebuild(cutoff)
+
+    def clear(self) -> None:
+        self._root = None
+        self._nodes.clear()
+        self._expiry.clear()
+        self._live = 0
+
+    def _is_live(self, node: _Node, now: datetime) -> bool:
+        return node.seen >= now - self.window
+
+    def _insert(self, node: _Node) -> None:
+        if self._root is None:
+            self._root = node
+            return
+
+        current = self._root
+        while True:
+            distance = levenshtein(node.plate, current.plate)
+            child = current.children.get(distance)
+            if child is None:
+                current.children[distance] = node
+                return
+            current = child
+
+    def _rebuild(self, cutoff: datetime) -> None:
+        live = [node for node in self._nodes.values() if node.seen >= cutoff]
+        self._root = None
+        self._nodes = {}
+        for node in live:
+            node.children = {}
+            self._nodes[node.plate] = node
+            self._insert(node)
+        self._live = len(live)